@@ -1,8 +1,10 @@
 """Configuration management for libra."""
 
 import os
+import stat
+import tempfile
 from collections.abc import Callable
-from enum import Enum
+from enum import StrEnum
 from pathlib import Path
 from typing import Any
 
@@ -12,7 +14,7 @@ from pydantic import BaseModel, Field
 from libra.core.models import LibrarianMode
 
 
-class EmbeddingProviderType(str, Enum):
+class EmbeddingProviderType(StrEnum):
     """Supported embedding providers."""
 
     GEMINI = "gemini"
@@ -26,7 +28,7 @@ class EmbeddingProviderType(str, Enum):
     CUSTOM = "custom"  # Custom HTTP endpoint
 
 
-class LLMProviderType(str, Enum):
+class LLMProviderType(StrEnum):
     """Supported LLM providers."""
 
     GEMINI = "gemini"
@@ -115,6 +117,37 @@ class LibrarianConfig(BaseModel):
     rules: list[LibrarianRule] = Field(default_factory=list)
 
 
+# Last parse of each config file: absolute path -> (mtime_ns, size, data)
+_CONFIG_CACHE: dict[str, tuple[int, int, dict[str, Any]]] = {}
+
+
+def _read_config_file(path: Path) -> dict[str, Any]:
+    """Read and parse a YAML config file, reusing the last parse if unchanged."""
+    st = path.stat()
+    key = os.path.abspath(path)
+    cached = _CONFIG_CACHE.get(key)
+    if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+        return cached[2]
+    with open(path) as f:
+        data: dict[str, Any] = yaml.safe_load(f) or {}
+    _CONFIG_CACHE[key] = (st.st_mtime_ns, st.st_size, data)
+    return data
+
+
+# Data directories already created by this process
+_DIRS_CREATED: set[str] = set()
+
+
+# Environment variable overrides: (env var, (dotted config path, converter))
+_ENV_OVERRIDES: tuple[tuple[str, tuple[str, Callable[[str], Any]]], ...] = (
+    ("LIBRA_DATA_DIR", ("data_dir", Path)),
+    ("LIBRA_LOG_LEVEL", ("log_level", str)),
+    ("LIBRA_LIBRARIAN_MODE", ("librarian.mode", LibrarianMode)),
+    ("LIBRA_EMBEDDING_PROVIDER", ("embedding.provider", str)),
+    ("LIBRA_SERVER_HTTP_PORT", ("server.http_port", int)),
+)
+
+
 class LibraConfig(BaseModel):
     """Main configuration for libra."""
 
@@ -163,9 +196,8 @@ class LibraConfig(BaseModel):
             path = Path.home() / ".libra" / "config.yaml"
 
         if path.exists():
-            with open(path) as f:
-                data = yaml.safe_load(f) or {}
-            config = cls.model_validate(data)
+            # Validate a fresh model each time since callers may mutate it
+            config = cls.model_validate(_read_config_file(path))
         else:
             config = cls()
             # Add default rules if no rules specified
@@ -179,24 +211,24 @@ class LibraConfig(BaseModel):
 
     def _apply_env_overrides(self) -> "LibraConfig":
         """Apply environment variable overrides."""
-        env_mapping: dict[str, tuple[str, Callable[[str], Any]]] = {
-            "LIBRA_DATA_DIR": ("data_dir", lambda x: Path(x)),
-            "LIBRA_LOG_LEVEL": ("log_level", str),
-            "LIBRA_LIBRARIAN_MODE": ("librarian.mode", LibrarianMode),
-            "LIBRA_EMBEDDING_PROVIDER": ("embedding.provider", str),
-            "LIBRA_SERVER_HTTP_PORT": ("server.http_port", int),
-        }
+        overrides = [
+            (path, converter(value))
+            for env_var, (path, converter) in _ENV_OVERRIDES
+            if (value := os.environ.get(env_var)) is not None
+        ]
+
+        # Skip the dump/validate round trip when nothing is overridden
+        if not overrides:
+            return self
 
         data = self.model_dump()
 
-        for env_var, (path, converter) in env_mapping.items():
-            value = os.environ.get(env_var)
-            if value is not None:
-                parts = path.split(".")
-                obj = data
-                for part in parts[:-1]:
-                    obj = obj[part]
-                obj[parts[-1]] = converter(value)
+        for path, value in overrides:
+            parts = path.split(".")
+            obj = data
+            for part in parts[:-1]:
+                obj = obj[part]
+            obj[parts[-1]] = value
 
         return LibraConfig.model_validate(data)
 
@@ -211,12 +243,33 @@ class LibraConfig(BaseModel):
         data = self.model_dump(mode="json")
         data["data_dir"] = str(self.data_dir)
 
-        with open(path, "w") as f:
-            yaml.safe_dump(data, f, default_flow_style=False, sort_keys=False)
+        # Keep the existing file's permissions (the config may hold API
+        # keys); new configs are private to the user
+        try:
+            mode = stat.S_IMODE(path.stat().st_mode)
+        except FileNotFoundError:
+            mode = 0o600
+
+        # Write to a unique sibling temp file and swap it in so a crash
+        # mid-write never leaves a truncated config behind
+        fd, tmp_name = tempfile.mkstemp(
+            dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w") as f:
+                os.chmod(tmp_name, mode)
+                yaml.safe_dump(data, f, default_flow_style=False, sort_keys=False)
+            os.replace(tmp_name, path)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
 
     def ensure_data_dir(self) -> None:
         """Ensure the data directory exists."""
-        self.data_dir.mkdir(parents=True, exist_ok=True)
+        key = os.fspath(self.data_dir)
+        if key not in _DIRS_CREATED:
+            self.data_dir.mkdir(parents=True, exist_ok=True)
+            _DIRS_CREATED.add(key)
 
     @property
     def db_path(self) -> Path:
@@ -1,8 +1,8 @@
 """Core data models for libra."""
 
 from datetime import datetime, timezone
-from enum import Enum
-from typing import Optional
+from enum import StrEnum
+from typing import Any, Optional
 from uuid import UUID, uuid4
 
 from pydantic import BaseModel, ConfigDict, Field
@@ -13,7 +13,13 @@ def utc_now() -> datetime:
     return datetime.now(timezone.utc)
 
 
-class ContextType(str, Enum):
+def _created_at(data: dict[str, Any]) -> datetime:
+    """Default updated_at to the record's created_at (one clock read)."""
+    created_at: datetime | None = data.get("created_at")
+    return created_at if created_at is not None else utc_now()
+
+
+class ContextType(StrEnum):
     """Types of context that libra can store and serve."""
 
     KNOWLEDGE = "knowledge"  # Facts, documentation, reference material
@@ -21,7 +27,7 @@ class ContextType(str, Enum):
     HISTORY = "history"  # Past interactions, decisions, events
 
 
-class RequestSource(str, Enum):
+class RequestSource(StrEnum):
     """Source of a context request."""
 
     MCP = "mcp"
@@ -29,7 +35,7 @@ class RequestSource(str, Enum):
     CLI = "cli"
 
 
-class LibrarianMode(str, Enum):
+class LibrarianMode(StrEnum):
     """Mode for the Librarian to operate in."""
 
     RULES = "rules"  # Pattern-based selection
@@ -49,7 +55,7 @@ class Context(BaseModel):
     source: str = "manual"  # file path, "manual", URL
     embedding: Optional[list[float]] = None
     created_at: datetime = Field(default_factory=utc_now)
-    updated_at: datetime = Field(default_factory=utc_now)
+    updated_at: datetime = Field(default_factory=_created_at)
     accessed_at: Optional[datetime] = None
     access_count: int = 0
     metadata: dict = Field(default_factory=dict)
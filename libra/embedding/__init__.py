@@ -12,12 +12,13 @@ Supported providers:
 - custom: Custom HTTP endpoint
 """
 
+import importlib
+
 from libra.embedding.base import EmbeddingProvider
 from libra.embedding.factory import (
     create_embedding_provider,
     get_supported_embedding_providers,
 )
-from libra.embedding.gemini import GeminiEmbeddingProvider
 
 __all__ = [
     "EmbeddingProvider",
@@ -27,39 +28,24 @@ __all__ = [
 ]
 
 
-# Lazy imports for optional providers - only load when accessed
-def __getattr__(name: str) -> type:
-    """Lazy load optional embedding providers."""
-    if name == "OpenAIEmbeddingProvider":
-        from libra.embedding.openai import OpenAIEmbeddingProvider
-
-        return OpenAIEmbeddingProvider
-    elif name == "OllamaEmbeddingProvider":
-        from libra.embedding.ollama import OllamaEmbeddingProvider
-
-        return OllamaEmbeddingProvider
-    elif name == "LocalEmbeddingProvider":
-        from libra.embedding.local import LocalEmbeddingProvider
-
-        return LocalEmbeddingProvider
-    elif name == "AzureOpenAIEmbeddingProvider":
-        from libra.embedding.azure_openai import AzureOpenAIEmbeddingProvider
+# Lazy imports for providers - only load their SDKs when accessed
+_LAZY_PROVIDERS: dict[str, str] = {
+    "GeminiEmbeddingProvider": "libra.embedding.gemini",
+    "OpenAIEmbeddingProvider": "libra.embedding.openai",
+    "OllamaEmbeddingProvider": "libra.embedding.ollama",
+    "LocalEmbeddingProvider": "libra.embedding.local",
+    "AzureOpenAIEmbeddingProvider": "libra.embedding.azure_openai",
+    "AWSBedrockEmbeddingProvider": "libra.embedding.aws_bedrock",
+    "HuggingFaceEmbeddingProvider": "libra.embedding.huggingface",
+    "TogetherEmbeddingProvider": "libra.embedding.together",
+    "CustomEmbeddingProvider": "libra.embedding.custom",
+}
 
-        return AzureOpenAIEmbeddingProvider
-    elif name == "AWSBedrockEmbeddingProvider":
-        from libra.embedding.aws_bedrock import AWSBedrockEmbeddingProvider
 
-        return AWSBedrockEmbeddingProvider
-    elif name == "HuggingFaceEmbeddingProvider":
-        from libra.embedding.huggingface import HuggingFaceEmbeddingProvider
-
-        return HuggingFaceEmbeddingProvider
-    elif name == "TogetherEmbeddingProvider":
-        from libra.embedding.together import TogetherEmbeddingProvider
-
-        return TogetherEmbeddingProvider
-    elif name == "CustomEmbeddingProvider":
-        from libra.embedding.custom import CustomEmbeddingProvider
-
-        return CustomEmbeddingProvider
-    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+def __getattr__(name: str) -> type:
+    """Lazy load embedding providers."""
+    module_name = _LAZY_PROVIDERS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    provider_class: type = getattr(importlib.import_module(module_name), name)
+    return provider_class
@@ -63,3 +63,18 @@ class EmbeddingProvider(ABC):
             A list of floats representing the embedding vector
         """
         return self.embed(document)
+
+    def embed_documents(self, documents: list[str]) -> list[list[float]]:
+        """Generate embeddings for multiple documents in one call.
+
+        By default, this is the same as embed_batch(). Providers that use
+        document-specific settings should override it alongside
+        embed_document().
+
+        Args:
+            documents: The document texts to embed
+
+        Returns:
+            List of embedding vectors, in input order
+        """
+        return self.embed_batch(documents)
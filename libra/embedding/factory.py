@@ -124,87 +124,94 @@ def create_embedding_provider(config: EmbeddingConfig) -> EmbeddingProvider:
         )
 
 
+# Static provider catalog, built once at import
+_SUPPORTED_EMBEDDING_PROVIDERS: tuple[dict[str, Any], ...] = (
+    {
+        "name": "gemini",
+        "display_name": "Google Gemini",
+        "description": "Google's Gemini embedding models (gemini-embedding-001)",
+        "env_vars": ["GOOGLE_AI_API_KEY", "GEMINI_API_KEY"],
+        "default_model": "gemini-embedding-001",
+        "default_dimensions": 768,
+    },
+    {
+        "name": "openai",
+        "display_name": "OpenAI",
+        "description": "OpenAI embedding models (text-embedding-3-small/large)",
+        "env_vars": ["OPENAI_API_KEY"],
+        "default_model": "text-embedding-3-small",
+        "default_dimensions": 1536,
+    },
+    {
+        "name": "ollama",
+        "display_name": "Ollama",
+        "description": "Local embedding models via Ollama",
+        "env_vars": [],
+        "default_model": "nomic-embed-text",
+        "default_dimensions": 768,
+        "requires": "Ollama running locally",
+    },
+    {
+        "name": "local",
+        "display_name": "Local (sentence-transformers)",
+        "description": "Fully local embeddings using sentence-transformers",
+        "env_vars": [],
+        "default_model": "all-MiniLM-L6-v2",
+        "default_dimensions": 384,
+        "requires": "sentence-transformers package",
+    },
+    {
+        "name": "azure_openai",
+        "display_name": "Azure OpenAI",
+        "description": "Azure-hosted OpenAI embedding models",
+        "env_vars": ["AZURE_OPENAI_API_KEY", "AZURE_OPENAI_ENDPOINT"],
+        "default_model": "text-embedding-3-small",
+        "default_dimensions": 1536,
+    },
+    {
+        "name": "aws_bedrock",
+        "display_name": "AWS Bedrock",
+        "description": "AWS Bedrock embedding models (Titan, Cohere)",
+        "env_vars": [],
+        "default_model": "amazon.titan-embed-text-v2:0",
+        "default_dimensions": 1024,
+        "requires": "AWS credentials configured",
+    },
+    {
+        "name": "huggingface",
+        "display_name": "HuggingFace",
+        "description": "HuggingFace Inference API embeddings",
+        "env_vars": ["HUGGINGFACE_API_KEY", "HF_TOKEN"],
+        "default_model": "sentence-transformers/all-MiniLM-L6-v2",
+        "default_dimensions": 384,
+    },
+    {
+        "name": "together",
+        "display_name": "Together AI",
+        "description": "Together AI embedding models",
+        "env_vars": ["TOGETHER_API_KEY"],
+        "default_model": "togethercomputer/m2-bert-80M-8k-retrieval",
+        "default_dimensions": 768,
+    },
+    {
+        "name": "custom",
+        "display_name": "Custom Endpoint",
+        "description": "Custom HTTP endpoint (OpenAI-compatible)",
+        "env_vars": ["CUSTOM_EMBEDDING_API_KEY"],
+        "default_model": "embedding-model",
+        "default_dimensions": 768,
+        "requires": "base_url configuration",
+    },
+)
+
+
 def get_supported_embedding_providers() -> list[dict[str, Any]]:
     """Get list of supported embedding providers with their details.
 
     Returns:
         List of provider info dictionaries
     """
+    # Fresh copies, so callers can mutate the result without touching the catalog
     return [
-        {
-            "name": "gemini",
-            "display_name": "Google Gemini",
-            "description": "Google's Gemini embedding models (gemini-embedding-001)",
-            "env_vars": ["GOOGLE_AI_API_KEY", "GEMINI_API_KEY"],
-            "default_model": "gemini-embedding-001",
-            "default_dimensions": 768,
-        },
-        {
-            "name": "openai",
-            "display_name": "OpenAI",
-            "description": "OpenAI embedding models (text-embedding-3-small/large)",
-            "env_vars": ["OPENAI_API_KEY"],
-            "default_model": "text-embedding-3-small",
-            "default_dimensions": 1536,
-        },
-        {
-            "name": "ollama",
-            "display_name": "Ollama",
-            "description": "Local embedding models via Ollama",
-            "env_vars": [],
-            "default_model": "nomic-embed-text",
-            "default_dimensions": 768,
-            "requires": "Ollama running locally",
-        },
-        {
-            "name": "local",
-            "display_name": "Local (sentence-transformers)",
-            "description": "Fully local embeddings using sentence-transformers",
-            "env_vars": [],
-            "default_model": "all-MiniLM-L6-v2",
-            "default_dimensions": 384,
-            "requires": "sentence-transformers package",
-        },
-        {
-            "name": "azure_openai",
-            "display_name": "Azure OpenAI",
-            "description": "Azure-hosted OpenAI embedding models",
-            "env_vars": ["AZURE_OPENAI_API_KEY", "AZURE_OPENAI_ENDPOINT"],
-            "default_model": "text-embedding-3-small",
-            "default_dimensions": 1536,
-        },
-        {
-            "name": "aws_bedrock",
-            "display_name": "AWS Bedrock",
-            "description": "AWS Bedrock embedding models (Titan, Cohere)",
-            "env_vars": [],
-            "default_model": "amazon.titan-embed-text-v2:0",
-            "default_dimensions": 1024,
-            "requires": "AWS credentials configured",
-        },
-        {
-            "name": "huggingface",
-            "display_name": "HuggingFace",
-            "description": "HuggingFace Inference API embeddings",
-            "env_vars": ["HUGGINGFACE_API_KEY", "HF_TOKEN"],
-            "default_model": "sentence-transformers/all-MiniLM-L6-v2",
-            "default_dimensions": 384,
-        },
-        {
-            "name": "together",
-            "display_name": "Together AI",
-            "description": "Together AI embedding models",
-            "env_vars": ["TOGETHER_API_KEY"],
-            "default_model": "togethercomputer/m2-bert-80M-8k-retrieval",
-            "default_dimensions": 768,
-        },
-        {
-            "name": "custom",
-            "display_name": "Custom Endpoint",
-            "description": "Custom HTTP endpoint (OpenAI-compatible)",
-            "env_vars": ["CUSTOM_EMBEDDING_API_KEY"],
-            "default_model": "embedding-model",
-            "default_dimensions": 768,
-            "requires": "base_url configuration",
-        },
+        dict(p, env_vars=list(p["env_vars"])) for p in _SUPPORTED_EMBEDDING_PROVIDERS
     ]
@@ -17,6 +17,9 @@ TaskType = Literal[
     "CLUSTERING",
 ]
 
+# Maximum number of contents the API accepts in one embed_content request
+_MAX_BATCH_SIZE = 100
+
 
 class GeminiEmbeddingProvider(EmbeddingProvider):
     """Embedding provider using Google's Gemini API.
@@ -53,11 +56,25 @@ class GeminiEmbeddingProvider(EmbeddingProvider):
         # Initialize the client
         self._client = genai.Client(api_key=api_key)
 
+        # Request configs are immutable per task type, so build each once
+        self._embed_configs: dict[str, types.EmbedContentConfig] = {}
+
     @property
     def dimensions(self) -> int:
         """Return the dimensionality of embeddings."""
         return self._dimensions
 
+    def _embed_config(self, task_type: TaskType) -> types.EmbedContentConfig:
+        """Return the cached request config for a task type."""
+        config = self._embed_configs.get(task_type)
+        if config is None:
+            config = types.EmbedContentConfig(
+                task_type=task_type,
+                output_dimensionality=self._dimensions,
+            )
+            self._embed_configs[task_type] = config
+        return config
+
     def embed(
         self,
         text: str,
@@ -76,10 +93,7 @@ class GeminiEmbeddingProvider(EmbeddingProvider):
             result = self._client.models.embed_content(
                 model=self.model,
                 contents=text,
-                config=types.EmbedContentConfig(
-                    task_type=task_type,
-                    output_dimensionality=self._dimensions,
-                ),
+                config=self._embed_config(task_type),
             )
             if result.embeddings is None or len(result.embeddings) == 0:
                 raise EmbeddingError("No embeddings returned from API")
@@ -110,23 +124,22 @@ class GeminiEmbeddingProvider(EmbeddingProvider):
             return []
 
         try:
-            # Process each text individually to work around SDK type constraints
+            # One request per slice of at most _MAX_BATCH_SIZE; each string
+            # becomes its own content and gets its own embedding, in input order
             embeddings: list[list[float]] = []
-            for text in texts:
+            for start in range(0, len(texts), _MAX_BATCH_SIZE):
+                chunk = list(texts[start : start + _MAX_BATCH_SIZE])
                 result = self._client.models.embed_content(
                     model=self.model,
-                    contents=text,
-                    config=types.EmbedContentConfig(
-                        task_type=task_type,
-                        output_dimensionality=self._dimensions,
-                    ),
+                    contents=chunk,
+                    config=self._embed_config(task_type),
                 )
-                if result.embeddings is None or len(result.embeddings) == 0:
-                    raise EmbeddingError("No embeddings returned from API")
-                values = result.embeddings[0].values
-                if values is None:
-                    raise EmbeddingError("Embedding values are None")
-                embeddings.append(list(values))
+                if result.embeddings is None or len(result.embeddings) != len(chunk):
+                    raise EmbeddingError("Embedding count does not match input count")
+                for embedding in result.embeddings:
+                    if embedding.values is None:
+                        raise EmbeddingError("Embedding values are None")
+                    embeddings.append(list(embedding.values))
             return embeddings
         except EmbeddingError:
             raise
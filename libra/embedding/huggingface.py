@@ -112,12 +112,10 @@ class HuggingFaceEmbeddingProvider(EmbeddingProvider):
             embeddings = []
             for item in data:
                 if isinstance(item[0], list):
-                    # Token-level embeddings - compute mean
-                    import statistics
-                    num_dims = len(item[0])
+                    # Token-level embeddings - mean-pool each dimension
+                    num_tokens = len(item)
                     mean_embedding = [
-                        statistics.mean(token[i] for token in item)
-                        for i in range(num_dims)
+                        sum(dim) / num_tokens for dim in zip(*item, strict=True)
                     ]
                     embeddings.append(mean_embedding)
                 else:
@@ -139,3 +139,27 @@ class LocalEmbeddingProvider(EmbeddingProvider):
             return self.embed(document)
         except Exception as e:
             raise EmbeddingError(f"Failed to generate document embedding: {e}", e)
+
+    def embed_documents(self, documents: list[str]) -> list[list[float]]:
+        """Generate embeddings for multiple documents.
+
+        Uses the model's document encoding if available.
+
+        Args:
+            documents: The document texts to embed
+
+        Returns:
+            List of embedding vectors
+        """
+        if not documents:
+            return []
+
+        try:
+            if hasattr(self._model, "encode_corpus"):
+                embeddings = self._model.encode_corpus(documents, convert_to_numpy=True)
+                return [emb.tolist() for emb in embeddings]
+            return self.embed_batch(documents)
+        except EmbeddingError:
+            raise
+        except Exception as e:
+            raise EmbeddingError(f"Failed to generate document embeddings: {e}", e)
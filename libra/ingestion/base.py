@@ -46,6 +46,6 @@ class Ingestor(ABC):
 
     @property
     @abstractmethod
-    def supported_extensions(self) -> list[str]:
-        """Return list of file extensions this ingestor supports."""
+    def supported_extensions(self) -> tuple[str, ...]:
+        """Return the file extensions this ingestor supports."""
         pass
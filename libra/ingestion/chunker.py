@@ -5,8 +5,13 @@ from dataclasses import dataclass
 
 from libra.utils.tokens import count_tokens
 
+# Patterns compiled once at import rather than on every chunk() call
+_CODE_BLOCK_RE = re.compile(r"```[\s\S]*?```", re.MULTILINE)
+_PARAGRAPH_BREAK_RE = re.compile(r"\n\n+")
+_SENTENCE_END_RE = re.compile(r"(?<=[.!?])\s+")
 
-@dataclass
+
+@dataclass(slots=True)
 class ChunkResult:
     """Result of chunking a document."""
 
@@ -86,11 +91,10 @@ class Chunker:
         segments = []
 
         # First, extract code blocks as they should stay intact
-        code_block_pattern = re.compile(r"```[\s\S]*?```", re.MULTILINE)
         current_pos = 0
         temp_segments = []
 
-        for match in code_block_pattern.finditer(text):
+        for match in _CODE_BLOCK_RE.finditer(text):
             # Add text before code block
             if match.start() > current_pos:
                 temp_segments.append((text[current_pos : match.start()], False))
@@ -112,9 +116,8 @@ class Chunker:
                 current_index += len(segment)
             else:
                 # Split by double newlines (paragraphs)
-                para_pattern = re.compile(r"\n\n+")
                 para_pos = 0
-                for match in para_pattern.finditer(segment):
+                for match in _PARAGRAPH_BREAK_RE.finditer(segment):
                     if match.start() > para_pos:
                         para = segment[para_pos : match.start()]
                         if para.strip():
@@ -236,7 +239,7 @@ class Chunker:
         chunks = []
 
         # Split by sentence-ending punctuation
-        sentences = re.split(r"(?<=[.!?])\s+", content)
+        sentences = _SENTENCE_END_RE.split(content)
 
         current_content = ""
         current_start = start_index
@@ -278,7 +281,7 @@ class Chunker:
     def _get_overlap_text(self, text: str) -> str:
         """Get overlap text from the end of a chunk."""
         # Get last few sentences
-        sentences = re.split(r"(?<=[.!?])\s+", text)
+        sentences = _SENTENCE_END_RE.split(text)
         overlap_text = ""
         overlap_tokens = 0
 
@@ -12,6 +12,22 @@ from libra.core.models import Context, ContextType
 from libra.ingestion.base import Ingestor
 from libra.ingestion.chunker import Chunker
 
+# Patterns always ignored, in addition to any .gitignore entries
+DEFAULT_IGNORE_PATTERNS: tuple[str, ...] = (
+    "__pycache__",
+    "*.pyc",
+    "node_modules",
+    ".git",
+    ".venv",
+    "venv",
+    ".env",
+    "*.egg-info",
+    "dist",
+    "build",
+    ".DS_Store",
+    "Thumbs.db",
+)
+
 
 class DirectoryIngestor(Ingestor):
     """Ingestor for directories.
@@ -44,18 +60,26 @@ class DirectoryIngestor(Ingestor):
         self.encoding = encoding
         self._file_count = 0
         self._ingestors: dict[str, Ingestor] = {}
+        self._extensions_cache: tuple[str, ...] | None = None
         self._gitignore_patterns: list[str] = []
+        self._ignore_names: frozenset[str] = frozenset()
+        self._ignore_dirs: frozenset[str] = frozenset()
+        self._ignore_suffixes: tuple[str, ...] = ()
+        self._ignore_prefixes: tuple[str, ...] = ()
 
         # Register default ingestors
         self._register_default_ingestors()
 
     @property
-    def supported_extensions(self) -> list[str]:
+    def supported_extensions(self) -> tuple[str, ...]:
         """Return supported file extensions (all registered)."""
-        extensions = []
-        for ingestor in self._ingestors.values():
-            extensions.extend(ingestor.supported_extensions)
-        return list(set(extensions))
+        # Rebuilt only after register_ingestor changes the registry
+        if self._extensions_cache is None:
+            extensions: set[str] = set()
+            for ingestor in self._ingestors.values():
+                extensions.update(ingestor.supported_extensions)
+            self._extensions_cache = tuple(extensions)
+        return self._extensions_cache
 
     def _register_default_ingestors(self) -> None:
         """Register default file type ingestors."""
@@ -79,6 +103,18 @@ class DirectoryIngestor(Ingestor):
             ingestor: Ingestor instance to use for this extension
         """
         self._ingestors[extension.lower()] = ingestor
+        self._extensions_cache = None
+
+    def get_ingestor(self, extension: str) -> Ingestor | None:
+        """Get the ingestor registered for a file extension.
+
+        Args:
+            extension: File extension (with dot, e.g., ".md")
+
+        Returns:
+            The registered ingestor, or None if the extension is unsupported
+        """
+        return self._ingestors.get(extension.lower())
 
     def can_ingest(self, source: str | Path) -> bool:
         """Check if this ingestor can handle the source."""
@@ -118,6 +154,7 @@ class DirectoryIngestor(Ingestor):
         # Load gitignore patterns if present
         if self.respect_gitignore:
             self._load_gitignore(path)
+        self._compile_gitignore()
 
         # Collect all files first
         files = list(self._collect_files(path, depth=0))
@@ -227,45 +264,44 @@ class DirectoryIngestor(Ingestor):
                 pass
 
         # Add common patterns
-        self._gitignore_patterns.extend([
-            "__pycache__",
-            "*.pyc",
-            "node_modules",
-            ".git",
-            ".venv",
-            "venv",
-            ".env",
-            "*.egg-info",
-            "dist",
-            "build",
-            ".DS_Store",
-            "Thumbs.db",
-        ])
+        self._gitignore_patterns.extend(DEFAULT_IGNORE_PATTERNS)
 
-    def _is_gitignored(self, path: Path) -> bool:
-        """Check if a path matches gitignore patterns."""
-        name = path.name
+    def _compile_gitignore(self) -> None:
+        """Sort gitignore patterns into lookup tables for _is_gitignored."""
+        names: set[str] = set()
+        dirs: set[str] = set()
+        suffixes: list[str] = []
+        prefixes: list[str] = []
 
         for pattern in self._gitignore_patterns:
             # Simple pattern matching (not full gitignore spec)
             if pattern.startswith("*"):
                 # Wildcard at start: *.pyc
-                if name.endswith(pattern[1:]):
-                    return True
+                suffixes.append(pattern[1:])
             elif pattern.endswith("*"):
                 # Wildcard at end: build*
-                if name.startswith(pattern[:-1]):
-                    return True
+                prefixes.append(pattern[:-1])
             elif pattern.endswith("/"):
                 # Directory pattern
-                if path.is_dir() and name == pattern[:-1]:
-                    return True
+                dirs.add(pattern[:-1])
             else:
                 # Exact match
-                if name == pattern:
-                    return True
+                names.add(pattern)
+
+        self._ignore_names = frozenset(names)
+        self._ignore_dirs = frozenset(dirs)
+        self._ignore_suffixes = tuple(suffixes)
+        self._ignore_prefixes = tuple(prefixes)
 
-        return False
+    def _is_gitignored(self, path: Path) -> bool:
+        """Check if a path matches gitignore patterns."""
+        name = path.name
+        return (
+            name in self._ignore_names
+            or name.endswith(self._ignore_suffixes)
+            or name.startswith(self._ignore_prefixes)
+            or (name in self._ignore_dirs and path.is_dir())
+        )
 
     def get_file_count(self, directory: Path) -> int:
         """Count files that would be processed.
@@ -280,6 +316,7 @@ class DirectoryIngestor(Ingestor):
         if self.respect_gitignore:
             self._gitignore_patterns = []
             self._load_gitignore(directory)
+        self._compile_gitignore()
 
         files = self._collect_files(directory, depth=0)
         return len(files)
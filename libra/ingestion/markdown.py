@@ -8,6 +8,16 @@ from libra.core.models import Context, ContextType
 from libra.ingestion.base import Ingestor
 from libra.ingestion.chunker import Chunker
 
+# Patterns compiled once at import rather than on every document
+_TITLE_RE = re.compile(r"^#\s+(.+)$", re.MULTILINE)
+# Headers of any level: group 1 is the #s, group 2 the header text
+_HEADER_RE = re.compile(r"^(#{1,6})\s+(.+)$", re.MULTILINE)
+_NON_TAG_CHARS_RE = re.compile(r"[^\w\s-]")
+_WHITESPACE_RE = re.compile(r"\s+")
+_CODE_BLOCK_RE = re.compile(r"```(\w*)\n([\s\S]*?)```", re.MULTILINE)
+# Standard Markdown links: [text](url)
+_LINK_RE = re.compile(r"\[([^\]]+)\]\(([^)]+)\)")
+
 
 class MarkdownIngestor(Ingestor):
     """Ingestor for Markdown files.
@@ -18,6 +28,8 @@ class MarkdownIngestor(Ingestor):
     - Links and references
     """
 
+    EXTENSIONS: tuple[str, ...] = (".md", ".markdown", ".mdown", ".mkd")
+
     def __init__(
         self,
         chunker: Chunker | None = None,
@@ -36,9 +48,9 @@ class MarkdownIngestor(Ingestor):
         self.encoding = encoding
 
     @property
-    def supported_extensions(self) -> list[str]:
+    def supported_extensions(self) -> tuple[str, ...]:
         """Return supported file extensions."""
-        return [".md", ".markdown", ".mdown", ".mkd"]
+        return self.EXTENSIONS
 
     def can_ingest(self, source: str | Path) -> bool:
         """Check if this ingestor can handle the source."""
@@ -91,7 +103,7 @@ class MarkdownIngestor(Ingestor):
     def _extract_title(self, content: str, fallback: str) -> str:
         """Extract document title from content."""
         # Look for first H1 header
-        match = re.search(r"^#\s+(.+)$", content, re.MULTILINE)
+        match = _TITLE_RE.search(content)
         if match:
             return match.group(1).strip()
         return fallback
@@ -99,11 +111,11 @@ class MarkdownIngestor(Ingestor):
     def _extract_headers(self, content: str) -> list[str]:
         """Extract all headers from content as potential tags."""
         headers = []
-        for match in re.finditer(r"^#{1,6}\s+(.+)$", content, re.MULTILINE):
-            header = match.group(1).strip()
+        for match in _HEADER_RE.finditer(content):
+            header = match.group(2).strip()
             # Clean up header: remove special chars, lowercase
-            clean = re.sub(r"[^\w\s-]", "", header).lower()
-            clean = re.sub(r"\s+", "-", clean)
+            clean = _NON_TAG_CHARS_RE.sub("", header).lower()
+            clean = _WHITESPACE_RE.sub("-", clean)
             if clean and len(clean) <= 50:  # Reasonable tag length
                 headers.append(clean)
         return headers
@@ -165,8 +177,8 @@ class MarkdownIngestor(Ingestor):
                 continue
 
             # Create tag from header
-            section_tag = re.sub(r"[^\w\s-]", "", header).lower()
-            section_tag = re.sub(r"\s+", "-", section_tag)
+            section_tag = _NON_TAG_CHARS_RE.sub("", header).lower()
+            section_tag = _WHITESPACE_RE.sub("-", section_tag)
             section_tags = tags + [section_tag] if section_tag else tags
 
             # Chunk section if needed
@@ -196,9 +208,6 @@ class MarkdownIngestor(Ingestor):
 
         Returns list of (header, content) tuples.
         """
-        # Pattern to match headers (any level)
-        header_pattern = re.compile(r"^(#{1,6})\s+(.+)$", re.MULTILINE)
-
         sections: list[tuple[str, str]] = []
         current_header = "Introduction"
         current_content: list[str] = []
@@ -208,7 +217,7 @@ class MarkdownIngestor(Ingestor):
 
         while i < len(lines):
             line = lines[i]
-            match = header_pattern.match(line)
+            match = _HEADER_RE.match(line)
 
             if match:
                 level = len(match.group(1))
@@ -245,9 +254,7 @@ class MarkdownIngestor(Ingestor):
         Returns list of dicts with 'language' and 'code' keys.
         """
         code_blocks = []
-        pattern = re.compile(r"```(\w*)\n([\s\S]*?)```", re.MULTILINE)
-
-        for match in pattern.finditer(content):
+        for match in _CODE_BLOCK_RE.finditer(content):
             language = match.group(1) or "text"
             code = match.group(2).strip()
             code_blocks.append({"language": language, "code": code})
@@ -262,8 +269,7 @@ class MarkdownIngestor(Ingestor):
         links = []
 
         # Standard Markdown links: [text](url)
-        link_pattern = re.compile(r"\[([^\]]+)\]\(([^)]+)\)")
-        for match in link_pattern.finditer(content):
+        for match in _LINK_RE.finditer(content):
             links.append({"text": match.group(1), "url": match.group(2)})
 
         return links
@@ -14,6 +14,8 @@ class TextIngestor(Ingestor):
     Handles .txt files and raw text content.
     """
 
+    EXTENSIONS: tuple[str, ...] = (".txt", ".text")
+
     def __init__(
         self,
         chunker: Chunker | None = None,
@@ -29,9 +31,9 @@ class TextIngestor(Ingestor):
         self.encoding = encoding
 
     @property
-    def supported_extensions(self) -> list[str]:
+    def supported_extensions(self) -> tuple[str, ...]:
         """Return supported file extensions."""
-        return [".txt", ".text"]
+        return self.EXTENSIONS
 
     def can_ingest(self, source: str | Path) -> bool:
         """Check if this ingestor can handle the source."""
@@ -61,7 +63,7 @@ class TextIngestor(Ingestor):
         tags = tags or []
 
         # Determine if source is a file or raw text
-        path = Path(source) if isinstance(source, Path) else Path(source)
+        path = Path(source)
 
         if path.exists() and path.is_file():
             return self._ingest_file(path, context_type, tags)
@@ -2,8 +2,9 @@
 
 import json
 import subprocess
+from collections.abc import Callable, Iterator
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 import typer
 from rich.console import Console
@@ -12,8 +13,9 @@ from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 
 from libra.core.config import EmbeddingConfig, LibraConfig, LLMConfig
-from libra.core.models import ContextType, LibrarianMode
+from libra.core.models import Context, ContextType, LibrarianMode
 from libra.service import LibraService
+from libra.utils.serialization import iter_json_array
 
 # Create CLI app
 app = typer.Typer(
@@ -542,6 +544,15 @@ def config_show() -> None:
     ))
 
 
+# Settable keys: dotted key -> (config section, field, value parser)
+_CONFIG_SET_FIELDS: dict[str, tuple[str, str, Callable[[str], Any]]] = {
+    "librarian.mode": ("librarian", "mode", LibrarianMode),
+    "defaults.token_budget": ("defaults", "token_budget", int),
+    "defaults.chunk_size": ("defaults", "chunk_size", int),
+    "server.http_port": ("server", "http_port", int),
+}
+
+
 @config_app.command("set")
 def config_set(
     key: str = typer.Argument(..., help="Configuration key (e.g., librarian.mode)"),
@@ -552,18 +563,14 @@ def config_set(
     config = service.config
 
     # Simple key mapping
-    if key == "librarian.mode":
-        config.librarian.mode = LibrarianMode(value)
-    elif key == "defaults.token_budget":
-        config.defaults.token_budget = int(value)
-    elif key == "defaults.chunk_size":
-        config.defaults.chunk_size = int(value)
-    elif key == "server.http_port":
-        config.server.http_port = int(value)
-    else:
+    field = _CONFIG_SET_FIELDS.get(key)
+    if field is None:
         console.print(f"[red]Unknown configuration key: {key}[/red]")
         raise typer.Exit(1)
 
+    section, name, parse = field
+    setattr(getattr(config, section), name, parse(value))
+
     config.save()
     console.print(f"[green]Set {key} = {value}[/green]")
 
@@ -630,23 +637,27 @@ def export_contexts(
     """Export all contexts to JSON."""
     service = get_service()
 
-    contexts = service.list_contexts(limit=10000)
-
-    output_data = [
-        {
-            "id": str(c.id),
-            "type": c.type,
-            "content": c.content,
-            "tags": c.tags,
-            "source": c.source,
-            "created_at": c.created_at.isoformat(),
-            "access_count": c.access_count,
-        }
-        for c in contexts
-    ]
+    count = 0
 
-    output.write_text(json.dumps(output_data, indent=2))
-    console.print(f"[green]Exported {len(contexts)} contexts to {output}[/green]")
+    def rows() -> Iterator[dict[str, Any]]:
+        nonlocal count
+        for c in service.iter_contexts():
+            count += 1
+            yield {
+                "id": str(c.id),
+                "type": c.type,
+                "content": c.content,
+                "tags": c.tags,
+                "source": c.source,
+                "created_at": c.created_at.isoformat(),
+                "access_count": c.access_count,
+            }
+
+    # Write the array element by element instead of building it in memory
+    with open(output, "w") as f:
+        for chunk in iter_json_array(rows()):
+            f.write(chunk)
+    console.print(f"[green]Exported {count} contexts to {output}[/green]")
 
 
 @app.command("import")
@@ -662,19 +673,44 @@ def import_contexts(
 
     data = json.loads(input_file.read_text())
 
-    count = 0
+    contexts: list[Context] = []
     for item in data:
         try:
-            service.add_context(
-                content=item["content"],
-                context_type=ContextType(item["type"]),
-                tags=item.get("tags", []),
-                source=item.get("source", "import"),
+            contexts.append(
+                Context(
+                    type=ContextType(item["type"]),
+                    content=item["content"],
+                    tags=item.get("tags", []),
+                    source=item.get("source", "import"),
+                )
             )
-            count += 1
         except Exception as e:
             console.print(f"[yellow]Failed to import: {e}[/yellow]")
 
+    # Embed and store in provider-sized batches rather than one call per item.
+    # Each batch is one transaction, so a failed batch stored nothing and
+    # its items can be retried one by one without duplicates.
+    batch_size = max(1, service.config.embedding.batch_size)
+    count = 0
+    for start in range(0, len(contexts), batch_size):
+        batch = contexts[start : start + batch_size]
+        try:
+            service.add_contexts(batch)
+            count += len(batch)
+            continue
+        except Exception as e:
+            console.print(
+                f"[yellow]Batch failed after {count} contexts were imported "
+                f"({e}); retrying its items one by one[/yellow]"
+            )
+
+        for context in batch:
+            try:
+                service.add_contexts([context])
+                count += 1
+            except Exception as e:
+                console.print(f"[yellow]Failed to import: {e}[/yellow]")
+
     console.print(f"[green]Imported {count} contexts from {input_file}[/green]")
 
 
@@ -7,13 +7,13 @@ Provides tools for AI agents to interact with libra:
 - forget: Delete a context
 """
 
-import json
 from typing import Optional
 
 from mcp.server.fastmcp import FastMCP
 
 from libra.core.models import ContextType, RequestSource
 from libra.service import LibraService
+from libra.utils.serialization import dumps
 
 # Usage instructions for LLMs
 USAGE_INSTRUCTIONS = """## Libra Context Orchestration - Usage Guide
@@ -189,7 +189,7 @@ def get_context(
         ],
     }
 
-    return json.dumps(result, indent=2)
+    return dumps(result)
 
 
 @mcp.tool()
@@ -237,7 +237,7 @@ def remember(
     try:
         context_type = ContextType(type.lower())
     except ValueError:
-        return json.dumps({
+        return dumps({
             "success": False,
             "error": f"Invalid type: {type}. Use knowledge, preference, or history.",
         })
@@ -251,7 +251,7 @@ def remember(
         source="mcp-remember",
     )
 
-    return json.dumps({
+    return dumps({
         "success": True,
         "id": str(context.id),
         "type": context.type,
@@ -299,14 +299,14 @@ def search(
         try:
             type_list = [ContextType(type.lower())]
         except ValueError:
-            return json.dumps({
+            return dumps({
                 "success": False,
                 "error": f"Invalid type: {type}",
             })
 
     results = service.search_contexts(query=query, types=type_list, limit=limit)
 
-    return json.dumps({
+    return dumps({
         "results": [
             {
                 "id": str(ctx.id),
@@ -351,7 +351,7 @@ def forget(context_id: str) -> str:
 
     deleted = service.delete_context(context_id)
 
-    return json.dumps({
+    return dumps({
         "success": deleted,
         "id": context_id,
         "message": "Context deleted" if deleted else "Context not found",
@@ -398,13 +398,13 @@ def list_contexts(
         try:
             type_list = [ContextType(type.lower())]
         except ValueError:
-            return json.dumps({"error": f"Invalid type: {type}"})
+            return dumps({"error": f"Invalid type: {type}"})
 
     tag_list = [t.strip() for t in tags.split(",")] if tags else None
 
     contexts = service.list_contexts(types=type_list, tags=tag_list, limit=limit)
 
-    return json.dumps({
+    return dumps({
         "count": len(contexts),
         "contexts": [
             {
@@ -443,7 +443,7 @@ def get_stats() -> str:
     service = get_service()
     stats = service.get_stats()
 
-    return json.dumps(stats)
+    return dumps(stats)
 
 
 @mcp.tool()
@@ -510,14 +510,14 @@ def resource_context_summary() -> str:
         "usage_hint": "Use get_context() with a task description to retrieve relevant contexts for your response."
     }
 
-    return json.dumps(summary, indent=2)
+    return dumps(summary)
 
 
 @mcp.resource("libra://stats")
 def resource_stats() -> str:
     """System statistics."""
     service = get_service()
-    return json.dumps(service.get_stats())
+    return dumps(service.get_stats())
 
 
 @mcp.resource("libra://contexts/all")
@@ -525,7 +525,7 @@ def resource_all_contexts() -> str:
     """All contexts (first 100)."""
     service = get_service()
     contexts = service.list_contexts(limit=100)
-    return json.dumps([
+    return dumps([
         {
             "id": str(c.id),
             "type": c.type,
@@ -541,7 +541,7 @@ def resource_knowledge() -> str:
     """Knowledge contexts."""
     service = get_service()
     contexts = service.list_contexts(types=[ContextType.KNOWLEDGE], limit=100)
-    return json.dumps([
+    return dumps([
         {"id": str(c.id), "content": c.content[:200], "tags": c.tags}
         for c in contexts
     ])
@@ -552,7 +552,7 @@ def resource_preferences() -> str:
     """Preference contexts."""
     service = get_service()
     contexts = service.list_contexts(types=[ContextType.PREFERENCE], limit=100)
-    return json.dumps([
+    return dumps([
         {"id": str(c.id), "content": c.content[:200], "tags": c.tags}
         for c in contexts
     ])
@@ -563,7 +563,7 @@ def resource_history() -> str:
     """History contexts."""
     service = get_service()
     contexts = service.list_contexts(types=[ContextType.HISTORY], limit=100)
-    return json.dumps([
+    return dumps([
         {"id": str(c.id), "content": c.content[:200], "tags": c.tags}
         for c in contexts
     ])
@@ -6,8 +6,8 @@ and configuring libra. Works without JavaScript for core functions.
 
 from __future__ import annotations
 
-import json
 import math
+from collections.abc import Iterator
 from pathlib import Path
 from typing import TYPE_CHECKING, Optional
 
@@ -15,13 +15,19 @@ from fastapi import APIRouter, Form, Query, Request
 
 if TYPE_CHECKING:
     from fastapi import FastAPI
-from fastapi.responses import HTMLResponse, RedirectResponse, Response
+from fastapi.responses import (
+    HTMLResponse,
+    RedirectResponse,
+    Response,
+    StreamingResponse,
+)
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 
 from libra.core.exceptions import ContextNotFoundError
 from libra.core.models import ContextType
 from libra.service import LibraService
+from libra.utils.serialization import iter_json_array
 
 # Setup paths
 WEB_DIR = Path(__file__).parent
@@ -54,7 +60,7 @@ def set_service(service: LibraService) -> None:
 
 # Dashboard
 @router.get("/", response_class=HTMLResponse, name="dashboard")
-async def dashboard(request: Request) -> HTMLResponse:
+def dashboard(request: Request) -> HTMLResponse:
     """Dashboard page with overview statistics."""
     service = get_service()
 
@@ -76,7 +82,7 @@ async def dashboard(request: Request) -> HTMLResponse:
 
 # Contexts List
 @router.get("/contexts", response_class=HTMLResponse, name="contexts_list")
-async def contexts_list(
+def contexts_list(
     request: Request,
     page: int = Query(1, ge=1),
     type: Optional[str] = Query(None),
@@ -107,9 +113,8 @@ async def contexts_list(
         offset=offset,
     )
 
-    # Get total count (approximate for now)
-    all_contexts = service.list_contexts(types=type_list, tags=tag_list, limit=10000)
-    total_contexts = len(all_contexts)
+    # Get total count
+    total_contexts = service.count_contexts(types=type_list, tags=tag_list)
     total_pages = math.ceil(total_contexts / per_page) if total_contexts > 0 else 1
 
     return templates.TemplateResponse(
@@ -130,7 +135,7 @@ async def contexts_list(
 
 # Add Context Page
 @router.get("/contexts/add", response_class=HTMLResponse, name="add_context_page")
-async def add_context_page(request: Request) -> HTMLResponse:
+def add_context_page(request: Request) -> HTMLResponse:
     """Add context form page."""
     return templates.TemplateResponse(
         request=request,
@@ -144,7 +149,7 @@ async def add_context_page(request: Request) -> HTMLResponse:
 
 # Add Context Submit
 @router.post("/contexts/add", response_class=HTMLResponse, name="add_context_submit")
-async def add_context_submit(
+def add_context_submit(
     request: Request,
     content: str = Form(...),
     type: str = Form("knowledge"),
@@ -184,7 +189,7 @@ async def add_context_submit(
 
 # Context Detail
 @router.get("/contexts/{context_id}", response_class=HTMLResponse, name="context_detail")
-async def context_detail(request: Request, context_id: str) -> HTMLResponse:
+def context_detail(request: Request, context_id: str) -> HTMLResponse:
     """View context details."""
     service = get_service()
 
@@ -213,7 +218,7 @@ async def context_detail(request: Request, context_id: str) -> HTMLResponse:
 
 # Edit Context Page
 @router.get("/contexts/{context_id}/edit", response_class=HTMLResponse, name="edit_context_page")
-async def edit_context_page(request: Request, context_id: str) -> Response:
+def edit_context_page(request: Request, context_id: str) -> Response:
     """Edit context form page."""
     service = get_service()
 
@@ -234,7 +239,7 @@ async def edit_context_page(request: Request, context_id: str) -> Response:
 
 # Edit Context Submit
 @router.post("/contexts/{context_id}/edit", response_class=HTMLResponse, name="edit_context_submit")
-async def edit_context_submit(
+def edit_context_submit(
     request: Request,
     context_id: str,
     content: str = Form(...),
@@ -262,7 +267,7 @@ async def edit_context_submit(
 
 # Delete Context Confirmation
 @router.get("/contexts/{context_id}/delete", response_class=HTMLResponse, name="delete_context_confirm")
-async def delete_context_confirm(request: Request, context_id: str) -> Response:
+def delete_context_confirm(request: Request, context_id: str) -> Response:
     """Delete confirmation page."""
     service = get_service()
 
@@ -283,7 +288,7 @@ async def delete_context_confirm(request: Request, context_id: str) -> Response:
 
 # Delete Context Submit
 @router.post("/contexts/{context_id}/delete", name="delete_context_submit")
-async def delete_context_submit(request: Request, context_id: str) -> Response:
+def delete_context_submit(request: Request, context_id: str) -> Response:
     """Handle delete context form submission."""
     service = get_service()
     service.delete_context(context_id)
@@ -292,7 +297,7 @@ async def delete_context_submit(request: Request, context_id: str) -> Response:
 
 # Audit Log
 @router.get("/audit", response_class=HTMLResponse, name="audit_page")
-async def audit_page(
+def audit_page(
     request: Request,
     page: int = Query(1, ge=1),
     agent_id: Optional[str] = Query(None),
@@ -310,11 +315,9 @@ async def audit_page(
     )
 
     # Get total count
-    all_entries = service.get_audit_log(
-        agent_id=agent_id if agent_id else None,
-        limit=10000,
+    total_entries = service.count_audit_entries(
+        agent_id=agent_id if agent_id else None
     )
-    total_entries = len(all_entries)
     total_pages = math.ceil(total_entries / per_page) if total_entries > 0 else 1
 
     return templates.TemplateResponse(
@@ -333,7 +336,7 @@ async def audit_page(
 
 # Settings Page
 @router.get("/settings", response_class=HTMLResponse, name="settings_page")
-async def settings_page(request: Request) -> HTMLResponse:
+def settings_page(request: Request) -> HTMLResponse:
     """Settings page."""
     service = get_service()
     config = service.config
@@ -366,29 +369,31 @@ async def settings_page(request: Request) -> HTMLResponse:
 
 # Export Contexts
 @router.get("/export", name="export_contexts")
-async def export_contexts(request: Request) -> Response:
+def export_contexts(request: Request) -> Response:
     """Export all contexts as JSON."""
     service = get_service()
-    contexts = service.list_contexts(limit=100000)
-
-    export_data = {
-        "version": "1.0",
-        "contexts": [
-            {
-                "id": str(ctx.id),
-                "type": ctx.type,
-                "content": ctx.content,
-                "tags": ctx.tags,
-                "source": ctx.source,
-                "created_at": ctx.created_at.isoformat(),
-                "updated_at": ctx.updated_at.isoformat(),
-            }
-            for ctx in contexts
-        ],
-    }
 
-    return Response(
-        content=json.dumps(export_data, indent=2),
+    rows = (
+        {
+            "id": str(ctx.id),
+            "type": ctx.type,
+            "content": ctx.content,
+            "tags": ctx.tags,
+            "source": ctx.source,
+            "created_at": ctx.created_at.isoformat(),
+            "updated_at": ctx.updated_at.isoformat(),
+        }
+        for ctx in service.iter_contexts()
+    )
+
+    def export_chunks() -> Iterator[str]:
+        # Same output as json.dumps({"version": ..., "contexts": [...]}, indent=2)
+        yield '{\n  "version": "1.0",\n  "contexts": '
+        yield from iter_json_array(rows, level=1)
+        yield "\n}"
+
+    return StreamingResponse(
+        export_chunks(),
         media_type="application/json",
         headers={"Content-Disposition": "attachment; filename=libra-export.json"},
     )
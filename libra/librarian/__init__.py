@@ -17,11 +17,11 @@ Supported LLM providers:
 - azure_openai, aws_bedrock, huggingface, together, custom
 """
 
+import importlib
+
 from libra.librarian.base import Librarian
 from libra.librarian.budget import BudgetManager
 from libra.librarian.hybrid import HybridLibrarian, create_librarian
-from libra.librarian.llm import GeminiLibrarian
-from libra.librarian.llm_generic import GenericLLMLibrarian
 from libra.librarian.rules import RulesLibrarian
 
 __all__ = [
@@ -33,3 +33,19 @@ __all__ = [
     "BudgetManager",
     "create_librarian",
 ]
+
+
+# Lazy imports for LLM librarians - only load provider SDKs when accessed
+_LAZY_LIBRARIANS: dict[str, str] = {
+    "GeminiLibrarian": "libra.librarian.llm",
+    "GenericLLMLibrarian": "libra.librarian.llm_generic",
+}
+
+
+def __getattr__(name: str) -> type:
+    """Lazy load LLM-backed librarians."""
+    module_name = _LAZY_LIBRARIANS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    librarian_class: type = getattr(importlib.import_module(module_name), name)
+    return librarian_class
@@ -1,6 +1,9 @@
 """Budget manager for token optimization."""
 
-from libra.core.models import ScoredContext
+from collections import defaultdict
+
+from libra.core.models import Context, ScoredContext
+from libra.utils.cache import LRUCache
 from libra.utils.tokens import count_tokens
 
 
@@ -24,6 +27,18 @@ class BudgetManager:
         """
         self.default_budget = default_budget
         self.type_allocation = type_allocation or {}
+        # Token counts per context version; the same contexts are budgeted
+        # across many queries and only change when updated_at moves
+        self._token_counts = LRUCache(maxsize=4096)
+
+    def _context_tokens(self, context: Context) -> int:
+        """Return the token count of a context, cached per content version."""
+        key = f"{context.id}:{context.updated_at.isoformat()}"
+        tokens: int | None = self._token_counts.get(key)
+        if tokens is None:
+            tokens = count_tokens(context.content)
+            self._token_counts.set(key, tokens)
+        return tokens
 
     def optimize(
         self,
@@ -56,7 +71,7 @@ class BudgetManager:
         tokens_used = 0
 
         for sc in contexts:
-            context_tokens = count_tokens(sc.context.content)
+            context_tokens = self._context_tokens(sc.context)
 
             if tokens_used + context_tokens <= budget:
                 selected.append(sc)
@@ -81,13 +96,11 @@ class BudgetManager:
         Returns:
             Tuple of (selected contexts, tokens used)
         """
-        # Group contexts by type (use string keys for type_allocation compatibility)
-        by_type: dict[str, list[ScoredContext]] = {}
+        # Group contexts by type. ContextType is a StrEnum, so the type is
+        # already a string key compatible with type_allocation.
+        by_type: defaultdict[str, list[ScoredContext]] = defaultdict(list)
         for sc in contexts:
-            ctx_type_str = sc.context.type if isinstance(sc.context.type, str) else sc.context.type.value
-            if ctx_type_str not in by_type:
-                by_type[ctx_type_str] = []
-            by_type[ctx_type_str].append(sc)
+            by_type[sc.context.type].append(sc)
 
         # Calculate budget per type
         type_budgets: dict[str, int] = {}
@@ -116,7 +129,7 @@ class BudgetManager:
 
             type_tokens = 0
             for sc in type_contexts:
-                context_tokens = count_tokens(sc.context.content)
+                context_tokens = self._context_tokens(sc.context)
                 if type_tokens + context_tokens <= type_budget:
                     selected.append(sc)
                     type_tokens += context_tokens
@@ -137,7 +150,7 @@ class BudgetManager:
         Returns:
             Estimated token count
         """
-        return sum(count_tokens(sc.context.content) for sc in contexts)
+        return sum(self._context_tokens(sc.context) for sc in contexts)
 
     def fits_budget(
         self,
@@ -1,5 +1,7 @@
 """Hybrid Librarian combining rules-based pre-filtering with LLM selection."""
 
+import heapq
+
 from libra.core.config import LibrarianRule, LLMConfig
 from libra.core.models import Context, ContextRequest, ScoredContext
 from libra.librarian.base import Librarian
@@ -76,16 +78,15 @@ class HybridLibrarian(Librarian):
             return []
 
         # Step 1: Rules-based pre-filtering
-        prefiltered = self.rules_librarian.select(request, candidates)
+        scored = self.rules_librarian.score(request, candidates)
 
         # Filter by minimum score
-        prefiltered = [
-            sc for sc in prefiltered if sc.relevance_score >= self.min_prefilter_score
-        ]
+        scored = [sc for sc in scored if sc.relevance_score >= self.min_prefilter_score]
 
-        # Limit candidates for LLM
-        if len(prefiltered) > self.prefilter_limit:
-            prefiltered = prefiltered[: self.prefilter_limit]
+        # Limit candidates for LLM, taking the best without sorting the rest
+        prefiltered = heapq.nlargest(
+            self.prefilter_limit, scored, key=lambda sc: sc.relevance_score
+        )
 
         if not prefiltered:
             # If no candidates pass rules, fall back to embedding-based candidates
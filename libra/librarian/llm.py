@@ -1,7 +1,9 @@
 """Gemini-based Librarian using LLM reasoning for context selection."""
 
+import heapq
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 from google import genai
 from google.genai import types
@@ -9,38 +11,9 @@ from google.genai import types
 from libra.core.exceptions import LibrarianError
 from libra.core.models import Context, ContextRequest, ScoredContext
 from libra.librarian.base import Librarian
-
-SELECTION_PROMPT = """You are an intelligent context selector for an AI assistant.
-
-Given a task description and a list of candidate contexts, evaluate each context's relevance to the task.
-
-TASK: {task}
-
-CANDIDATE CONTEXTS:
-{contexts}
-
-For each context, provide a relevance score from 0.0 to 1.0:
-- 1.0: Highly relevant, essential for the task
-- 0.7-0.9: Relevant, would significantly help
-- 0.4-0.6: Somewhat relevant, might be useful
-- 0.1-0.3: Marginally relevant
-- 0.0: Not relevant at all
-
-Consider:
-1. Direct relevance to the task keywords and intent
-2. Whether the context provides useful background or constraints
-3. The context type (knowledge, preference, history) and how it applies
-4. Recency for historical contexts
-
-Return ONLY a valid JSON object with this structure:
-{{
-  "selections": [
-    {{"id": "context-id-1", "score": 0.85, "reason": "brief reason"}},
-    {{"id": "context-id-2", "score": 0.4, "reason": "brief reason"}}
-  ]
-}}
-
-Include ALL contexts in your response, even with score 0.0."""
+from libra.librarian.llm_generic import SELECTION_PROMPT
+from libra.utils.cache import LRUCache
+from libra.utils.serialization import loads
 
 
 class GeminiLibrarian(Librarian):
@@ -56,6 +29,8 @@ class GeminiLibrarian(Librarian):
         api_key: str | None = None,
         max_candidates_per_request: int = 30,
         min_score: float = 0.3,
+        max_concurrent_batches: int = 4,
+        response_cache_size: int = 128,
     ):
         """Initialize the Gemini Librarian.
 
@@ -64,10 +39,15 @@ class GeminiLibrarian(Librarian):
             api_key: Google AI API key (or use GOOGLE_AI_API_KEY/GEMINI_API_KEY env var)
             max_candidates_per_request: Maximum candidates to evaluate per LLM call
             min_score: Minimum score to include in results
+            max_concurrent_batches: Maximum batches scored in parallel
+            response_cache_size: Number of Gemini responses to memoize (0 disables)
         """
         self.model_name = model
         self.max_candidates = max_candidates_per_request
         self.min_score = min_score
+        if max_concurrent_batches < 1:
+            raise ValueError("max_concurrent_batches must be at least 1")
+        self.max_concurrent_batches = max_concurrent_batches
 
         # Get API key from parameter or environment
         api_key = api_key or os.environ.get("GOOGLE_AI_API_KEY") or os.environ.get("GEMINI_API_KEY")
@@ -85,6 +65,10 @@ class GeminiLibrarian(Librarian):
             temperature=0.1,  # Low temperature for consistent scoring
         )
 
+        # Identical task + candidate prompts are common (repeated queries);
+        # reuse the Gemini response instead of paying another round trip
+        self._response_cache = LRUCache(maxsize=response_cache_size)
+
     def select(
         self,
         request: ContextRequest,
@@ -118,12 +102,16 @@ class GeminiLibrarian(Librarian):
         prompt = SELECTION_PROMPT.format(task=request.task, contexts=contexts_text)
 
         try:
-            response = self._client.models.generate_content(
-                model=self.model_name,
-                contents=prompt,
-                config=self._generation_config,
-            )
-            response_text = response.text or ""
+            cache_key = LRUCache.make_key(self.model_name, prompt)
+            response_text = self._response_cache.get(cache_key)
+            if response_text is None:
+                response = self._client.models.generate_content(
+                    model=self.model_name,
+                    contents=prompt,
+                    config=self._generation_config,
+                )
+                response_text = response.text or ""
+                self._response_cache.set(cache_key, response_text)
             selections = self._parse_response(response_text, filtered)
 
             # Filter by minimum score and sort
@@ -141,31 +129,30 @@ class GeminiLibrarian(Librarian):
         request: ContextRequest,
     ) -> list[Context]:
         """Apply request filters to candidates."""
-        filtered = candidates
-
-        if request.types:
-            filtered = [c for c in filtered if c.type in request.types]
-
-        if request.tags:
-            filtered = [
-                c for c in filtered if any(t in c.tags for t in request.tags)
-            ]
-
-        return filtered
+        if not request.types and not request.tags:
+            return candidates
+
+        # Single pass with set lookups instead of one list scan per filter
+        types = set(request.types) if request.types else None
+        tags = set(request.tags) if request.tags else None
+        return [
+            c
+            for c in candidates
+            if (types is None or c.type in types)
+            and (tags is None or not tags.isdisjoint(c.tags))
+        ]
 
     def _format_candidates(self, candidates: list[Context]) -> str:
         """Format candidates for the prompt."""
-        lines = []
-        for ctx in candidates:
-            # Truncate content for prompt efficiency
-            content = ctx.content[:500] + "..." if len(ctx.content) > 500 else ctx.content
-            lines.append(
-                f"ID: {ctx.id}\n"
-                f"Type: {ctx.type}\n"
-                f"Tags: {', '.join(ctx.tags)}\n"
-                f"Content: {content}\n"
-            )
-        return "\n---\n".join(lines)
+        # Build each entry in a single f-string and join once; content is
+        # truncated for prompt efficiency without an intermediate concat
+        return "\n---\n".join(
+            f"ID: {ctx.id}\n"
+            f"Type: {ctx.type}\n"
+            f"Tags: {', '.join(ctx.tags)}\n"
+            f"Content: {ctx.content[:500]}{'...' if len(ctx.content) > 500 else ''}\n"
+            for ctx in candidates
+        )
 
     def _parse_response(
         self,
@@ -177,7 +164,7 @@ class GeminiLibrarian(Librarian):
         id_to_context = {str(c.id): c for c in candidates}
 
         try:
-            data = json.loads(response_text)
+            data = loads(response_text)
             selections = data.get("selections", [])
 
             scored = []
@@ -213,18 +200,23 @@ class GeminiLibrarian(Librarian):
             for i in range(0, len(candidates), self.max_candidates)
         ]
 
-        # Process each batch
-        all_scored: list[ScoredContext] = []
-        for batch in batches:
-            batch_scored = self.select(request, batch)
-            # Take top half from each batch
-            all_scored.extend(batch_scored[: len(batch_scored) // 2 + 1])
+        # Score batches concurrently; each one is an independent LLM round trip
+        workers = min(len(batches), self.max_concurrent_batches)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(lambda batch: self.select(request, batch), batches)
+
+            all_scored: list[ScoredContext] = []
+            for batch_scored in results:
+                # Take top half from each batch
+                all_scored.extend(batch_scored[: len(batch_scored) // 2 + 1])
 
         # If still too many, do final selection
         if len(all_scored) > self.max_candidates:
-            # Sort by score and take top candidates
-            all_scored.sort(key=lambda x: x.relevance_score, reverse=True)
-            final_candidates = [s.context for s in all_scored[: self.max_candidates]]
+            # Take the top candidates by score without sorting the rest
+            top_scored = heapq.nlargest(
+                self.max_candidates, all_scored, key=lambda x: x.relevance_score
+            )
+            final_candidates = [s.context for s in top_scored]
             return self.select(request, final_candidates)
 
         # Sort and return
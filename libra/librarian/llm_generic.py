@@ -1,5 +1,7 @@
 """Generic LLM-based Librarian using the LLM provider abstraction."""
 
+import heapq
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from libra.core.config import LLMConfig
@@ -8,16 +10,14 @@ from libra.core.models import Context, ContextRequest, ScoredContext
 from libra.librarian.base import Librarian
 from libra.llm_providers.base import LLMProvider
 from libra.llm_providers.factory import create_llm_provider
+from libra.utils.cache import LRUCache
 
+# Static instructions come first and the per-request task and candidates
+# last, so providers with prompt-prefix caching can reuse the shared prefix
 SELECTION_PROMPT = """You are an intelligent context selector for an AI assistant.
 
 Given a task description and a list of candidate contexts, evaluate each context's relevance to the task.
 
-TASK: {task}
-
-CANDIDATE CONTEXTS:
-{contexts}
-
 For each context, provide a relevance score from 0.0 to 1.0:
 - 1.0: Highly relevant, essential for the task
 - 0.7-0.9: Relevant, would significantly help
@@ -39,7 +39,12 @@ Return ONLY a valid JSON object with this structure:
   ]
 }}
 
-Include ALL contexts in your response, even with score 0.0."""
+Include ALL contexts in your response, even with score 0.0.
+
+TASK: {task}
+
+CANDIDATE CONTEXTS:
+{contexts}"""
 
 
 class GenericLLMLibrarian(Librarian):
@@ -55,6 +60,8 @@ class GenericLLMLibrarian(Librarian):
         llm_config: LLMConfig | None = None,
         max_candidates_per_request: int = 30,
         min_score: float = 0.3,
+        max_concurrent_batches: int = 4,
+        response_cache_size: int = 128,
     ):
         """Initialize the Generic LLM Librarian.
 
@@ -63,6 +70,8 @@ class GenericLLMLibrarian(Librarian):
             llm_config: LLM configuration to create a provider
             max_candidates_per_request: Maximum candidates to evaluate per LLM call
             min_score: Minimum score to include in results
+            max_concurrent_batches: Maximum batches scored in parallel
+            response_cache_size: Number of LLM responses to memoize (0 disables)
         """
         if llm_provider is not None:
             self._llm = llm_provider
@@ -74,6 +83,12 @@ class GenericLLMLibrarian(Librarian):
 
         self.max_candidates = max_candidates_per_request
         self.min_score = min_score
+        if max_concurrent_batches < 1:
+            raise ValueError("max_concurrent_batches must be at least 1")
+        self.max_concurrent_batches = max_concurrent_batches
+        # Identical task + candidate prompts are common (repeated queries);
+        # reuse the parsed LLM response instead of paying another round trip
+        self._response_cache = LRUCache(maxsize=response_cache_size)
 
     @property
     def model_name(self) -> str:
@@ -113,7 +128,11 @@ class GenericLLMLibrarian(Librarian):
         prompt = SELECTION_PROMPT.format(task=request.task, contexts=contexts_text)
 
         try:
-            response_data = self._llm.generate_json(prompt)
+            cache_key = LRUCache.make_key(self._llm.model_name, prompt)
+            response_data = self._response_cache.get(cache_key)
+            if response_data is None:
+                response_data = self._llm.generate_json(prompt)
+                self._response_cache.set(cache_key, response_data)
             selections = self._parse_response(response_data, filtered)
 
             # Filter by minimum score and sort
@@ -134,31 +153,30 @@ class GenericLLMLibrarian(Librarian):
         request: ContextRequest,
     ) -> list[Context]:
         """Apply request filters to candidates."""
-        filtered = candidates
-
-        if request.types:
-            filtered = [c for c in filtered if c.type in request.types]
-
-        if request.tags:
-            filtered = [
-                c for c in filtered if any(t in c.tags for t in request.tags)
-            ]
-
-        return filtered
+        if not request.types and not request.tags:
+            return candidates
+
+        # Single pass with set lookups instead of one list scan per filter
+        types = set(request.types) if request.types else None
+        tags = set(request.tags) if request.tags else None
+        return [
+            c
+            for c in candidates
+            if (types is None or c.type in types)
+            and (tags is None or not tags.isdisjoint(c.tags))
+        ]
 
     def _format_candidates(self, candidates: list[Context]) -> str:
         """Format candidates for the prompt."""
-        lines = []
-        for ctx in candidates:
-            # Truncate content for prompt efficiency
-            content = ctx.content[:500] + "..." if len(ctx.content) > 500 else ctx.content
-            lines.append(
-                f"ID: {ctx.id}\n"
-                f"Type: {ctx.type}\n"
-                f"Tags: {', '.join(ctx.tags)}\n"
-                f"Content: {content}\n"
-            )
-        return "\n---\n".join(lines)
+        # Build each entry in a single f-string and join once; content is
+        # truncated for prompt efficiency without an intermediate concat
+        return "\n---\n".join(
+            f"ID: {ctx.id}\n"
+            f"Type: {ctx.type}\n"
+            f"Tags: {', '.join(ctx.tags)}\n"
+            f"Content: {ctx.content[:500]}{'...' if len(ctx.content) > 500 else ''}\n"
+            for ctx in candidates
+        )
 
     def _parse_response(
         self,
@@ -201,18 +219,23 @@ class GenericLLMLibrarian(Librarian):
             for i in range(0, len(candidates), self.max_candidates)
         ]
 
-        # Process each batch
-        all_scored: list[ScoredContext] = []
-        for batch in batches:
-            batch_scored = self.select(request, batch)
-            # Take top half from each batch
-            all_scored.extend(batch_scored[: len(batch_scored) // 2 + 1])
+        # Score batches concurrently; each one is an independent LLM round trip
+        workers = min(len(batches), self.max_concurrent_batches)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(lambda batch: self.select(request, batch), batches)
+
+            all_scored: list[ScoredContext] = []
+            for batch_scored in results:
+                # Take top half from each batch
+                all_scored.extend(batch_scored[: len(batch_scored) // 2 + 1])
 
         # If still too many, do final selection
         if len(all_scored) > self.max_candidates:
-            # Sort by score and take top candidates
-            all_scored.sort(key=lambda x: x.relevance_score, reverse=True)
-            final_candidates = [s.context for s in all_scored[: self.max_candidates]]
+            # Take the top candidates by score without sorting the rest
+            top_scored = heapq.nlargest(
+                self.max_candidates, all_scored, key=lambda x: x.relevance_score
+            )
+            final_candidates = [s.context for s in top_scored]
             return self.select(request, final_candidates)
 
         # Sort and return
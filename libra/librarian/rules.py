@@ -1,12 +1,25 @@
 """Rules-based Librarian for pattern-based context selection."""
 
 import re
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 
-from libra.core.config import LibrarianRule
+from libra.core.config import LibraConfig, LibrarianRule
 from libra.core.models import Context, ContextRequest, ScoredContext
 from libra.librarian.base import Librarian
 
 
+@lru_cache(maxsize=1024)
+def _content_words(content: str) -> frozenset[str]:
+    """Return the lowercased word set of a context's content.
+
+    The same contexts come back as candidates across queries, so their
+    word sets are memoized instead of re-split for every request.
+    """
+    return frozenset(content.lower().split())
+
+
 class RulesLibrarian(Librarian):
     """Rules-based Librarian using pattern matching.
 
@@ -21,8 +34,6 @@ class RulesLibrarian(Librarian):
         Args:
             rules: List of rules for context selection. If None, uses defaults.
         """
-        from libra.core.config import LibraConfig
-
         self.rules = rules if rules is not None else LibraConfig.default_rules()
         # Compile regex patterns for efficiency
         self._compiled_rules = [
@@ -43,6 +54,30 @@ class RulesLibrarian(Librarian):
         Returns:
             List of scored contexts sorted by relevance (highest first)
         """
+        scored = self.score(request, candidates)
+
+        # Sort by score descending
+        scored.sort(key=lambda x: x.relevance_score, reverse=True)
+
+        return scored
+
+    def score(
+        self,
+        request: ContextRequest,
+        candidates: list[Context],
+    ) -> list[ScoredContext]:
+        """Score contexts using rule-based matching, without sorting.
+
+        Callers that only need the top few results can pick them with
+        heapq instead of paying for a full sort.
+
+        Args:
+            request: The context request with task description
+            candidates: List of candidate contexts to evaluate
+
+        Returns:
+            List of scored contexts with a positive score, in candidate order
+        """
         if not candidates:
             return []
 
@@ -52,30 +87,77 @@ class RulesLibrarian(Librarian):
             if pattern.search(request.task):
                 matched_rules.append(rule)
 
+        # Contexts accessed after this cutoff get a recency boost
+        recent_cutoff = datetime.now(timezone.utc) - timedelta(days=7)
+
+        # Fold matched rules into per-type and per-tag boosts once per query
+        type_boosts, tag_boosts = self._boost_tables(matched_rules)
+
+        # Lowercase and split the task once, not once per candidate
+        task_words = set(request.task.lower().split())
+
+        # Request filters as sets, checked before any scoring work
+        type_filter = set(request.types) if request.types else None
+        tag_filter = set(request.tags) if request.tags else None
+
         # Score each candidate
         scored = []
         for context in candidates:
-            score = self._calculate_score(context, matched_rules, request)
+            if type_filter is not None and context.type not in type_filter:
+                continue
+            if tag_filter is not None and tag_filter.isdisjoint(context.tags):
+                continue
+
+            score = self._calculate_score(
+                context, type_boosts, tag_boosts, recent_cutoff, task_words
+            )
             if score > 0:
-                scored.append(ScoredContext(context=context, relevance_score=score))
-
-        # Sort by score descending
-        scored.sort(key=lambda x: x.relevance_score, reverse=True)
+                # Scores are already clamped to (0, 1]; skip field validation
+                scored.append(
+                    ScoredContext.model_construct(
+                        context=context, relevance_score=score
+                    )
+                )
 
         return scored
 
+    @staticmethod
+    def _boost_tables(
+        matched_rules: list[LibrarianRule],
+    ) -> tuple[dict[str, float], dict[str, float]]:
+        """Sum the boosts of the matched rules by context type and by tag.
+
+        Args:
+            matched_rules: Rules that matched the task
+
+        Returns:
+            Tuple of (boost per context type, boost per tag)
+        """
+        type_boosts: defaultdict[str, float] = defaultdict(float)
+        tag_boosts: defaultdict[str, float] = defaultdict(float)
+        for rule in matched_rules:
+            for ctx_type in set(rule.boost_types):
+                type_boosts[ctx_type] += 0.2 * rule.weight
+            for tag in set(rule.boost_tags):
+                tag_boosts[tag] += 0.15 * rule.weight
+        return dict(type_boosts), dict(tag_boosts)
+
     def _calculate_score(
         self,
         context: Context,
-        matched_rules: list[LibrarianRule],
-        request: ContextRequest,
+        type_boosts: dict[str, float],
+        tag_boosts: dict[str, float],
+        recent_cutoff: datetime,
+        task_words: set[str],
     ) -> float:
         """Calculate relevance score for a context.
 
         Args:
             context: The context to score
-            matched_rules: Rules that matched the task
-            request: The original request for filter checking
+            type_boosts: Rule boost per context type
+            tag_boosts: Rule boost per tag
+            recent_cutoff: Access time after which a context counts as recent
+            task_words: Lowercased words of the task
 
         Returns:
             Relevance score between 0 and 1
@@ -83,43 +165,25 @@ class RulesLibrarian(Librarian):
         # Base score
         base_score = 0.3
 
-        # Apply type and tag filters from request
-        if request.types and context.type not in request.types:
-            return 0.0
-
-        if request.tags and not any(tag in context.tags for tag in request.tags):
-            return 0.0
-
         # Apply matched rules
-        rule_boost = 0.0
-        for rule in matched_rules:
-            # Check type boost
-            if context.type in rule.boost_types:
-                rule_boost += 0.2 * rule.weight
-
-            # Check tag boost
+        rule_boost = type_boosts.get(context.type, 0.0)
+        if tag_boosts:
             for tag in context.tags:
-                if tag in rule.boost_tags:
-                    rule_boost += 0.15 * rule.weight
+                rule_boost += tag_boosts.get(tag, 0.0)
 
         # Check for keyword overlap between task and content
-        task_words = set(request.task.lower().split())
-        content_words = set(context.content.lower().split())
-        overlap = len(task_words & content_words)
+        overlap = len(task_words & _content_words(context.content))
         keyword_boost = min(0.3, overlap * 0.05)
 
         # Recency boost (more recently accessed = higher score)
         recency_boost = 0.0
         if context.accessed_at:
             # Simple heuristic: if accessed in last 7 days, boost
-            from datetime import datetime, timedelta, timezone
-
-            now = datetime.now(timezone.utc)
             accessed = context.accessed_at
             # Handle both naive and aware datetimes
             if accessed.tzinfo is None:
                 accessed = accessed.replace(tzinfo=timezone.utc)
-            if now - accessed < timedelta(days=7):
+            if accessed > recent_cutoff:
                 recency_boost = 0.1
 
         # Access frequency boost
@@ -12,12 +12,13 @@ Supported providers:
 - custom: Custom HTTP endpoint
 """
 
+import importlib
+
 from libra.llm_providers.base import LLMProvider
 from libra.llm_providers.factory import (
     create_llm_provider,
     get_supported_llm_providers,
 )
-from libra.llm_providers.gemini import GeminiLLMProvider
 
 __all__ = [
     "LLMProvider",
@@ -27,39 +28,24 @@ __all__ = [
 ]
 
 
-# Lazy imports for optional providers - only load when accessed
-def __getattr__(name: str) -> type:
-    """Lazy load optional LLM providers."""
-    if name == "OpenAILLMProvider":
-        from libra.llm_providers.openai import OpenAILLMProvider
-
-        return OpenAILLMProvider
-    elif name == "AnthropicLLMProvider":
-        from libra.llm_providers.anthropic import AnthropicLLMProvider
-
-        return AnthropicLLMProvider
-    elif name == "OllamaLLMProvider":
-        from libra.llm_providers.ollama import OllamaLLMProvider
-
-        return OllamaLLMProvider
-    elif name == "AzureOpenAILLMProvider":
-        from libra.llm_providers.azure_openai import AzureOpenAILLMProvider
+# Lazy imports for providers - only load their SDKs when accessed
+_LAZY_PROVIDERS: dict[str, str] = {
+    "GeminiLLMProvider": "libra.llm_providers.gemini",
+    "OpenAILLMProvider": "libra.llm_providers.openai",
+    "AnthropicLLMProvider": "libra.llm_providers.anthropic",
+    "OllamaLLMProvider": "libra.llm_providers.ollama",
+    "AzureOpenAILLMProvider": "libra.llm_providers.azure_openai",
+    "AWSBedrockLLMProvider": "libra.llm_providers.aws_bedrock",
+    "HuggingFaceLLMProvider": "libra.llm_providers.huggingface",
+    "TogetherLLMProvider": "libra.llm_providers.together",
+    "CustomLLMProvider": "libra.llm_providers.custom",
+}
 
-        return AzureOpenAILLMProvider
-    elif name == "AWSBedrockLLMProvider":
-        from libra.llm_providers.aws_bedrock import AWSBedrockLLMProvider
 
-        return AWSBedrockLLMProvider
-    elif name == "HuggingFaceLLMProvider":
-        from libra.llm_providers.huggingface import HuggingFaceLLMProvider
-
-        return HuggingFaceLLMProvider
-    elif name == "TogetherLLMProvider":
-        from libra.llm_providers.together import TogetherLLMProvider
-
-        return TogetherLLMProvider
-    elif name == "CustomLLMProvider":
-        from libra.llm_providers.custom import CustomLLMProvider
-
-        return CustomLLMProvider
-    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+def __getattr__(name: str) -> type:
+    """Lazy load LLM providers."""
+    module_name = _LAZY_PROVIDERS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    provider_class: type = getattr(importlib.import_module(module_name), name)
+    return provider_class
@@ -1,8 +1,11 @@
 """Base class for LLM providers used by the Librarian."""
 
+import json
 from abc import ABC, abstractmethod
 from typing import Any, cast
 
+from libra.utils.serialization import loads
+
 
 class LLMProvider(ABC):
     """Abstract base class for LLM providers.
@@ -57,8 +60,6 @@ class LLMProvider(ABC):
         Raises:
             ValueError: If the response is not valid JSON
         """
-        import json
-
         response = self.generate(
             prompt,
             json_mode=True,
@@ -78,6 +79,6 @@ class LLMProvider(ABC):
                 text = text[:-3]
             text = text.strip()
 
-            return cast(dict[str, Any], json.loads(text))
+            return cast(dict[str, Any], loads(text))
         except json.JSONDecodeError as e:
             raise ValueError(f"Failed to parse JSON response: {e}\nResponse: {response}")
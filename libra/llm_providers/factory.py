@@ -117,77 +117,84 @@ def create_llm_provider(config: LLMConfig) -> LLMProvider:
         )
 
 
+# Static provider catalog, built once at import
+_SUPPORTED_LLM_PROVIDERS: tuple[dict[str, Any], ...] = (
+    {
+        "name": "gemini",
+        "display_name": "Google Gemini",
+        "description": "Google's Gemini models (gemini-2.5-flash)",
+        "env_vars": ["GOOGLE_AI_API_KEY", "GEMINI_API_KEY"],
+        "default_model": "gemini-2.5-flash",
+    },
+    {
+        "name": "openai",
+        "display_name": "OpenAI",
+        "description": "OpenAI GPT models (gpt-4o-mini, gpt-4o)",
+        "env_vars": ["OPENAI_API_KEY"],
+        "default_model": "gpt-4o-mini",
+    },
+    {
+        "name": "anthropic",
+        "display_name": "Anthropic Claude",
+        "description": "Anthropic Claude models (claude-3-5-haiku, claude-3-5-sonnet)",
+        "env_vars": ["ANTHROPIC_API_KEY"],
+        "default_model": "claude-3-5-haiku-latest",
+    },
+    {
+        "name": "ollama",
+        "display_name": "Ollama",
+        "description": "Local models via Ollama (llama3.2, mistral, etc.)",
+        "env_vars": [],
+        "default_model": "llama3.2",
+        "requires": "Ollama running locally",
+    },
+    {
+        "name": "azure_openai",
+        "display_name": "Azure OpenAI",
+        "description": "Azure-hosted OpenAI models",
+        "env_vars": ["AZURE_OPENAI_API_KEY", "AZURE_OPENAI_ENDPOINT"],
+        "default_model": "gpt-4o-mini",
+    },
+    {
+        "name": "aws_bedrock",
+        "display_name": "AWS Bedrock",
+        "description": "AWS Bedrock models (Claude, Llama, Titan)",
+        "env_vars": [],
+        "default_model": "anthropic.claude-3-5-haiku-20241022-v1:0",
+        "requires": "AWS credentials configured",
+    },
+    {
+        "name": "huggingface",
+        "display_name": "HuggingFace",
+        "description": "HuggingFace Inference API",
+        "env_vars": ["HUGGINGFACE_API_KEY", "HF_TOKEN"],
+        "default_model": "meta-llama/Llama-3.2-3B-Instruct",
+    },
+    {
+        "name": "together",
+        "display_name": "Together AI",
+        "description": "Together AI inference API",
+        "env_vars": ["TOGETHER_API_KEY"],
+        "default_model": "meta-llama/Llama-3.2-3B-Instruct-Turbo",
+    },
+    {
+        "name": "custom",
+        "display_name": "Custom Endpoint",
+        "description": "Custom HTTP endpoint (OpenAI-compatible)",
+        "env_vars": ["CUSTOM_LLM_API_KEY"],
+        "default_model": "default",
+        "requires": "base_url configuration",
+    },
+)
+
+
 def get_supported_llm_providers() -> list[dict[str, Any]]:
     """Get list of supported LLM providers with their details.
 
     Returns:
         List of provider info dictionaries
     """
+    # Fresh copies, so callers can mutate the result without touching the catalog
     return [
-        {
-            "name": "gemini",
-            "display_name": "Google Gemini",
-            "description": "Google's Gemini models (gemini-2.5-flash)",
-            "env_vars": ["GOOGLE_AI_API_KEY", "GEMINI_API_KEY"],
-            "default_model": "gemini-2.5-flash",
-        },
-        {
-            "name": "openai",
-            "display_name": "OpenAI",
-            "description": "OpenAI GPT models (gpt-4o-mini, gpt-4o)",
-            "env_vars": ["OPENAI_API_KEY"],
-            "default_model": "gpt-4o-mini",
-        },
-        {
-            "name": "anthropic",
-            "display_name": "Anthropic Claude",
-            "description": "Anthropic Claude models (claude-3-5-haiku, claude-3-5-sonnet)",
-            "env_vars": ["ANTHROPIC_API_KEY"],
-            "default_model": "claude-3-5-haiku-latest",
-        },
-        {
-            "name": "ollama",
-            "display_name": "Ollama",
-            "description": "Local models via Ollama (llama3.2, mistral, etc.)",
-            "env_vars": [],
-            "default_model": "llama3.2",
-            "requires": "Ollama running locally",
-        },
-        {
-            "name": "azure_openai",
-            "display_name": "Azure OpenAI",
-            "description": "Azure-hosted OpenAI models",
-            "env_vars": ["AZURE_OPENAI_API_KEY", "AZURE_OPENAI_ENDPOINT"],
-            "default_model": "gpt-4o-mini",
-        },
-        {
-            "name": "aws_bedrock",
-            "display_name": "AWS Bedrock",
-            "description": "AWS Bedrock models (Claude, Llama, Titan)",
-            "env_vars": [],
-            "default_model": "anthropic.claude-3-5-haiku-20241022-v1:0",
-            "requires": "AWS credentials configured",
-        },
-        {
-            "name": "huggingface",
-            "display_name": "HuggingFace",
-            "description": "HuggingFace Inference API",
-            "env_vars": ["HUGGINGFACE_API_KEY", "HF_TOKEN"],
-            "default_model": "meta-llama/Llama-3.2-3B-Instruct",
-        },
-        {
-            "name": "together",
-            "display_name": "Together AI",
-            "description": "Together AI inference API",
-            "env_vars": ["TOGETHER_API_KEY"],
-            "default_model": "meta-llama/Llama-3.2-3B-Instruct-Turbo",
-        },
-        {
-            "name": "custom",
-            "display_name": "Custom Endpoint",
-            "description": "Custom HTTP endpoint (OpenAI-compatible)",
-            "env_vars": ["CUSTOM_LLM_API_KEY"],
-            "default_model": "default",
-            "requires": "base_url configuration",
-        },
+        dict(p, env_vars=list(p["env_vars"])) for p in _SUPPORTED_LLM_PROVIDERS
     ]
@@ -45,12 +45,38 @@ class GeminiLLMProvider(LLMProvider):
 
         self._client = genai.Client(api_key=api_key)
         self._types = types
+        # Generation configs keyed by (json_mode, temperature, max_tokens)
+        self._configs: dict[tuple[bool, float, int | None], Any] = {}
 
     @property
     def model_name(self) -> str:
         """Return the model name."""
         return self._model
 
+    def _generation_config(
+        self,
+        json_mode: bool,
+        temperature: float,
+        max_tokens: int | None,
+    ) -> Any:
+        """Return a cached GenerateContentConfig for the given settings."""
+        key = (json_mode, temperature, max_tokens)
+        config = self._configs.get(key)
+        if config is None:
+            config_kwargs: dict[str, Any] = {
+                "temperature": temperature,
+            }
+
+            if json_mode:
+                config_kwargs["response_mime_type"] = "application/json"
+
+            if max_tokens is not None:
+                config_kwargs["max_output_tokens"] = max_tokens
+
+            config = self._types.GenerateContentConfig(**config_kwargs)
+            self._configs[key] = config
+        return config
+
     def generate(
         self,
         prompt: str,
@@ -70,17 +96,7 @@ class GeminiLLMProvider(LLMProvider):
             The generated text response
         """
         try:
-            config_kwargs: dict[str, Any] = {
-                "temperature": temperature,
-            }
-
-            if json_mode:
-                config_kwargs["response_mime_type"] = "application/json"
-
-            if max_tokens is not None:
-                config_kwargs["max_output_tokens"] = max_tokens
-
-            config = self._types.GenerateContentConfig(**config_kwargs)
+            config = self._generation_config(json_mode, temperature, max_tokens)
 
             response = self._client.models.generate_content(
                 model=self._model,
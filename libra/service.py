@@ -6,7 +6,7 @@ context storage, retrieval, and intelligent selection.
 
 import logging
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from pathlib import Path
 from typing import Any
 from uuid import UUID
@@ -22,14 +22,15 @@ from libra.core.models import (
 )
 from libra.embedding.base import EmbeddingProvider
 from libra.embedding.factory import create_embedding_provider
+from libra.ingestion.base import Ingestor
 from libra.ingestion.chunker import Chunker
 from libra.ingestion.directory import DirectoryIngestor
-from libra.ingestion.markdown import MarkdownIngestor
 from libra.ingestion.text import TextIngestor
 from libra.librarian.base import Librarian
 from libra.librarian.budget import BudgetManager
 from libra.librarian.hybrid import create_librarian
 from libra.storage.database import ContextStore
+from libra.utils.cache import LRUCache
 
 logger = logging.getLogger("libra.service")
 
@@ -72,11 +73,14 @@ class LibraService:
         self._budget_manager: BudgetManager | None = None
         self._chunker: Chunker | None = None
 
-        # Ingestors
+        # Ingestors (file ingestors are shared with the directory registry)
         self._text_ingestor: TextIngestor | None = None
-        self._markdown_ingestor: MarkdownIngestor | None = None
         self._directory_ingestor: DirectoryIngestor | None = None
 
+        # Agents often repeat the same task or search text; reuse its
+        # query embedding instead of calling the provider again
+        self._query_embeddings = LRUCache(maxsize=256)
+
     @property
     def store(self) -> ContextStore:
         """Get the context store, initializing if needed."""
@@ -109,7 +113,7 @@ class LibraService:
         """
         if self._librarian is None:
             self._librarian = create_librarian(
-                mode=self.config.librarian.mode.value,
+                mode=self.config.librarian.mode,
                 rules=self.config.librarian.rules or LibraConfig.default_rules(),
                 llm_config=self.config.librarian.llm,
             )
@@ -133,6 +137,24 @@ class LibraService:
             )
         return self._chunker
 
+    @property
+    def directory_ingestor(self) -> DirectoryIngestor:
+        """Get the directory ingestor, which also owns the per-extension registry."""
+        if self._directory_ingestor is None:
+            self._directory_ingestor = DirectoryIngestor(chunker=self.chunker)
+        return self._directory_ingestor
+
+    @property
+    def text_ingestor(self) -> TextIngestor:
+        """Get the plain text ingestor, reusing the registered one if possible."""
+        if self._text_ingestor is None:
+            ingestor = self.directory_ingestor.get_ingestor(".txt")
+            if isinstance(ingestor, TextIngestor):
+                self._text_ingestor = ingestor
+            else:
+                self._text_ingestor = TextIngestor(chunker=self.chunker)
+        return self._text_ingestor
+
     # Context Management
 
     def add_context(
@@ -172,6 +194,19 @@ class LibraService:
         logger.debug(f"Added context {context.id} of type {context.type}")
         return context
 
+    def add_contexts(self, contexts: list[Context]) -> list[Context]:
+        """Add many new contexts, embedding and storing them in batches.
+
+        Args:
+            contexts: Newly created contexts without embeddings
+
+        Returns:
+            The stored Context objects
+        """
+        self._embed_and_store(contexts)
+        logger.debug(f"Added {len(contexts)} contexts")
+        return contexts
+
     def get_context(self, context_id: UUID | str) -> Context:
         """Get a context by ID.
 
@@ -203,15 +238,23 @@ class LibraService:
         """
         context = self.store.get_context(context_id)
 
-        if content is not None:
+        # Only touch fields (and storage) that actually change, so re-saving
+        # an unchanged form costs neither an embedding call nor a write
+        content_changed = content is not None and content != context.content
+        tags_changed = tags is not None and tags != context.tags
+        if not content_changed and not tags_changed:
+            return context
+
+        reembed = content_changed and regenerate_embedding
+        if content_changed and content is not None:
             context.update_content(content)
-            if regenerate_embedding:
+            if reembed:
                 context.embedding = self.embedding_provider.embed_document(content)
 
-        if tags is not None:
+        if tags_changed and tags is not None:
             context.tags = tags
 
-        self.store.update_context(context)
+        self.store.update_context(context, update_embedding=reembed)
         return context
 
     def delete_context(self, context_id: UUID | str) -> bool:
@@ -245,6 +288,35 @@ class LibraService:
         """
         return self.store.list_contexts(types, tags, limit, offset)
 
+    def count_contexts(
+        self,
+        types: list[ContextType] | None = None,
+        tags: list[str] | None = None,
+    ) -> int:
+        """Count contexts with optional filtering.
+
+        Args:
+            types: Filter by context types
+            tags: Filter by tags
+
+        Returns:
+            Number of matching contexts
+        """
+        return self.store.count_contexts(types, tags)
+
+    def iter_contexts(self) -> Iterator[Context]:
+        """Iterate over all contexts, newest first, without embeddings.
+
+        Contexts are read one row at a time, in the same order as
+        list_contexts, so exports can be streamed instead of held in memory.
+
+        Yields:
+            Context objects
+        """
+        yield from self.store.iter_contexts(
+            include_embeddings=False, newest_first=True
+        )
+
     def search_contexts(
         self,
         query: str,
@@ -263,9 +335,27 @@ class LibraService:
         Returns:
             List of (Context, similarity_score) tuples
         """
-        query_embedding = self.embedding_provider.embed_query(query)
+        query_embedding = self._embed_query(query)
         return self.store.search_by_embedding(query_embedding, limit, types, tags)
 
+    def _embed_query(self, text: str) -> list[float]:
+        """Embed a search query, reusing recent results.
+
+        Args:
+            text: Query or task text
+
+        Returns:
+            Query embedding vector
+        """
+        cache_key = LRUCache.make_key(
+            self.config.embedding.provider, self.config.embedding.model, text
+        )
+        embedding: list[float] | None = self._query_embeddings.get(cache_key)
+        if embedding is None:
+            embedding = self.embedding_provider.embed_query(text)
+            self._query_embeddings.set(cache_key, embedding)
+        return embedding
+
     # Context Query (Main Feature)
 
     def query(
@@ -307,7 +397,7 @@ class LibraService:
         )
 
         # Step 1: Get candidate contexts via embedding similarity
-        query_embedding = self.embedding_provider.embed_query(task)
+        query_embedding = self._embed_query(task)
         candidates_with_scores = self.store.search_by_embedding(
             query_embedding,
             limit=100,
@@ -361,6 +451,24 @@ class LibraService:
 
     # Ingestion
 
+    def _embed_and_store(self, contexts: list[Context]) -> None:
+        """Embed ingested contexts in provider batches and store them.
+
+        Each batch is written in a single transaction.
+
+        Args:
+            contexts: Newly created contexts without embeddings
+        """
+        batch_size = max(1, self.config.embedding.batch_size)
+        for start in range(0, len(contexts), batch_size):
+            batch = contexts[start : start + batch_size]
+            embeddings = self.embedding_provider.embed_documents(
+                [ctx.content for ctx in batch]
+            )
+            for ctx, embedding in zip(batch, embeddings, strict=True):
+                ctx.embedding = embedding
+            self.store.add_contexts(batch)
+
     def ingest_text(
         self,
         content: str,
@@ -379,16 +487,9 @@ class LibraService:
         Returns:
             List of created Context objects
         """
-        if self._text_ingestor is None:
-            self._text_ingestor = TextIngestor(chunker=self.chunker)
-
-        contexts = self._text_ingestor.ingest_raw(content, context_type, tags, source)
-
-        # Generate embeddings and store
-        for ctx in contexts:
-            ctx.embedding = self.embedding_provider.embed_document(ctx.content)
-            self.store.add_context(ctx)
+        contexts = self.text_ingestor.ingest_raw(content, context_type, tags, source)
 
+        self._embed_and_store(contexts)
         return contexts
 
     def ingest_file(
@@ -409,20 +510,13 @@ class LibraService:
         """
         path = Path(path)
 
-        if path.suffix.lower() in [".md", ".markdown"]:
-            if self._markdown_ingestor is None:
-                self._markdown_ingestor = MarkdownIngestor(chunker=self.chunker)
-            contexts = self._markdown_ingestor.ingest(path, context_type, tags)
-        else:
-            if self._text_ingestor is None:
-                self._text_ingestor = TextIngestor(chunker=self.chunker)
-            contexts = self._text_ingestor.ingest(path, context_type, tags)
-
-        # Generate embeddings and store
-        for ctx in contexts:
-            ctx.embedding = self.embedding_provider.embed_document(ctx.content)
-            self.store.add_context(ctx)
+        # Pick the registered ingestor for the extension, defaulting to plain text
+        ingestor: Ingestor = (
+            self.directory_ingestor.get_ingestor(path.suffix) or self.text_ingestor
+        )
+        contexts = ingestor.ingest(path, context_type, tags)
 
+        self._embed_and_store(contexts)
         return contexts
 
     def ingest_directory(
@@ -443,18 +537,11 @@ class LibraService:
         Returns:
             List of created Context objects
         """
-        if self._directory_ingestor is None:
-            self._directory_ingestor = DirectoryIngestor(chunker=self.chunker)
-
-        contexts = self._directory_ingestor.ingest(
+        contexts = self.directory_ingestor.ingest(
             path, context_type, tags, progress_callback
         )
 
-        # Generate embeddings and store
-        for ctx in contexts:
-            ctx.embedding = self.embedding_provider.embed_document(ctx.content)
-            self.store.add_context(ctx)
-
+        self._embed_and_store(contexts)
         return contexts
 
     # Audit and Stats
@@ -477,6 +564,17 @@ class LibraService:
         """
         return self.store.get_audit_entries(agent_id, limit, offset)
 
+    def count_audit_entries(self, agent_id: str | None = None) -> int:
+        """Count audit log entries.
+
+        Args:
+            agent_id: Filter by agent
+
+        Returns:
+            Number of matching entries
+        """
+        return self.store.count_audit_entries(agent_id)
+
     def get_stats(self) -> dict:
         """Get storage statistics.
 
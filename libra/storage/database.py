@@ -2,7 +2,10 @@
 
 import json
 import sqlite3
-import struct
+import threading
+import weakref
+from array import array
+from contextlib import closing
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Iterator
@@ -18,21 +21,57 @@ from libra.core.models import (
     LibrarianMode,
     RequestSource,
 )
+from libra.utils.serialization import dumps, loads
+
+# Value -> member maps for decoding audit rows without Enum.__call__
+_REQUEST_SOURCES: dict[str, RequestSource] = {m.value: m for m in RequestSource}
+_LIBRARIAN_MODES: dict[str, LibrarianMode] = {m.value: m for m in LibrarianMode}
 
 
 def serialize_float32(vector: list[float]) -> bytes:
     """Serialize a list of floats to bytes for sqlite-vec."""
-    return struct.pack(f"{len(vector)}f", *vector)
+    # array packs in C without unpacking the vector into call arguments
+    return array("f", vector).tobytes()
 
 
 def deserialize_float32(data: bytes) -> list[float]:
     """Deserialize bytes back to a list of floats."""
-    n = len(data) // 4
-    return list(struct.unpack(f"{n}f", data))
+    floats = array("f")
+    floats.frombytes(data)
+    return floats.tolist()
+
+
+class _ThreadConnection:
+    """Holder for one thread's connection, kept only in thread-local storage.
+
+    The holder is dropped when its thread exits, which triggers the
+    finalizer registered in ContextStore.conn to close the connection.
+    """
+
+    __slots__ = ("conn", "__weakref__")
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+
+
+def _release_connection(
+    conn: sqlite3.Connection,
+    connections: set[sqlite3.Connection],
+    lock: threading.Lock,
+) -> None:
+    """Close a connection whose thread has exited and forget it."""
+    with lock:
+        connections.discard(conn)
+    conn.close()
 
 
 class ContextStore:
-    """SQLite-based storage with vector search capabilities."""
+    """SQLite-based storage with vector search capabilities.
+
+    Each thread gets its own connection (web and API handlers run in a
+    thread pool), closed again when that thread exits. With WAL journaling, readers on different threads run
+    concurrently and SQLite itself serializes writers.
+    """
 
     def __init__(self, db_path: Path | str, vector_dimensions: int = 768):
         """Initialize the context store.
@@ -43,19 +82,48 @@ class ContextStore:
         """
         self.db_path = Path(db_path)
         self.vector_dimensions = vector_dimensions
-        self._conn: sqlite3.Connection | None = None
+        self._local = threading.local()
+        self._connections: set[sqlite3.Connection] = set()
+        self._connections_lock = threading.Lock()
         self._initialize_db()
 
     @property
     def conn(self) -> sqlite3.Connection:
-        """Get the database connection, creating if necessary."""
-        if self._conn is None:
-            self._conn = sqlite3.connect(str(self.db_path))
-            self._conn.row_factory = sqlite3.Row
-            self._conn.enable_load_extension(True)
-            sqlite_vec.load(self._conn)
-            self._conn.enable_load_extension(False)
-        return self._conn
+        """Get this thread's database connection, creating if necessary."""
+        holder: _ThreadConnection | None = getattr(self._local, "holder", None)
+        if holder is None:
+            conn = self._connect()
+            holder = _ThreadConnection(conn)
+            self._local.holder = holder
+            with self._connections_lock:
+                self._connections.add(conn)
+            # Pool threads come and go (anyio retires idle workers), so close
+            # the connection once its thread's local storage is released
+            weakref.finalize(
+                holder,
+                _release_connection,
+                conn,
+                self._connections,
+                self._connections_lock,
+            )
+        return holder.conn
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open and configure a new connection."""
+        # check_same_thread=False only so close() and the thread-exit
+        # finalizer can close it; each connection is otherwise used by one
+        # thread
+        conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.enable_load_extension(True)
+        sqlite_vec.load(conn)
+        conn.enable_load_extension(False)
+        # WAL lets readers proceed during writes and turns each commit
+        # into a sequential log append; NORMAL sync is durable in WAL mode
+        # except for the last transactions on power loss
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
 
     def _initialize_db(self) -> None:
         """Create database tables if they don't exist."""
@@ -131,40 +199,62 @@ class ContextStore:
     def add_context(self, context: Context) -> None:
         """Add a context to the store."""
         try:
-            self.conn.execute(
-                """
-                INSERT INTO contexts (id, type, content, tags, source, created_at,
-                                      updated_at, accessed_at, access_count, metadata)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-                (
-                    str(context.id),
-                    context.type,
-                    context.content,
-                    json.dumps(context.tags),
-                    context.source,
-                    context.created_at.isoformat(),
-                    context.updated_at.isoformat(),
-                    context.accessed_at.isoformat() if context.accessed_at else None,
-                    context.access_count,
-                    json.dumps(context.metadata),
-                ),
-            )
+            self._insert_context(context)
+            self.conn.commit()
+        except sqlite3.Error as e:
+            self.conn.rollback()
+            raise StorageError(f"Failed to add context: {e}")
 
-            # Add embedding if present
-            if context.embedding:
-                self.conn.execute(
-                    """
-                    INSERT INTO context_embeddings (context_id, embedding)
-                    VALUES (?, ?)
-                """,
-                    (str(context.id), serialize_float32(context.embedding)),
-                )
+    def add_contexts(self, contexts: list[Context]) -> None:
+        """Add many contexts in a single transaction.
+
+        Either all contexts are stored or, on error, none are.
 
+        Args:
+            contexts: Contexts to add
+        """
+        if not contexts:
+            return
+
+        try:
+            for context in contexts:
+                self._insert_context(context)
             self.conn.commit()
         except sqlite3.Error as e:
             self.conn.rollback()
-            raise StorageError(f"Failed to add context: {e}")
+            raise StorageError(f"Failed to add contexts: {e}")
+
+    def _insert_context(self, context: Context) -> None:
+        """Insert a context and its embedding without committing."""
+        self.conn.execute(
+            """
+            INSERT INTO contexts (id, type, content, tags, source, created_at,
+                                  updated_at, accessed_at, access_count, metadata)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+            (
+                str(context.id),
+                context.type,
+                context.content,
+                dumps(context.tags),
+                context.source,
+                context.created_at.isoformat(),
+                context.updated_at.isoformat(),
+                context.accessed_at.isoformat() if context.accessed_at else None,
+                context.access_count,
+                dumps(context.metadata),
+            ),
+        )
+
+        # Add embedding if present
+        if context.embedding:
+            self.conn.execute(
+                """
+                INSERT INTO context_embeddings (context_id, embedding)
+                VALUES (?, ?)
+            """,
+                (str(context.id), serialize_float32(context.embedding)),
+            )
 
     def get_context(self, context_id: UUID | str) -> Context:
         """Get a context by ID."""
@@ -178,8 +268,14 @@ class ContextStore:
 
         return self._row_to_context(row)
 
-    def update_context(self, context: Context) -> None:
-        """Update an existing context."""
+    def update_context(
+        self, context: Context, update_embedding: bool = True
+    ) -> None:
+        """Update an existing context.
+
+        The stored embedding is replaced only when ``update_embedding`` is set
+        and the context carries one.
+        """
         try:
             self.conn.execute(
                 """
@@ -191,18 +287,18 @@ class ContextStore:
                 (
                     context.type,
                     context.content,
-                    json.dumps(context.tags),
+                    dumps(context.tags),
                     context.source,
                     context.updated_at.isoformat(),
                     context.accessed_at.isoformat() if context.accessed_at else None,
                     context.access_count,
-                    json.dumps(context.metadata),
+                    dumps(context.metadata),
                     str(context.id),
                 ),
             )
 
             # Update embedding if present
-            if context.embedding:
+            if update_embedding and context.embedding:
                 # Delete old embedding
                 self.conn.execute(
                     "DELETE FROM context_embeddings WHERE context_id = ?",
@@ -245,14 +341,48 @@ class ContextStore:
         tags: list[str] | None = None,
         limit: int = 100,
         offset: int = 0,
+        include_embeddings: bool = False,
     ) -> list[Context]:
-        """List contexts with optional filtering."""
-        query = "SELECT * FROM contexts WHERE 1=1"
+        """List contexts with optional filtering.
+
+        Embeddings are only loaded when ``include_embeddings`` is set, since
+        list views never display them.
+        """
+        where, params = self._context_filters(types, tags)
+        query = f"SELECT * FROM contexts WHERE {where}"
+        query += " ORDER BY created_at DESC LIMIT ? OFFSET ?"
+        params.extend([limit, offset])
+
+        cursor = self.conn.execute(query, params)
+        return [
+            self._row_to_context(row, include_embedding=include_embeddings)
+            for row in cursor.fetchall()
+        ]
+
+    def count_contexts(
+        self,
+        types: list[ContextType] | None = None,
+        tags: list[str] | None = None,
+    ) -> int:
+        """Count contexts matching the same filters as list_contexts."""
+        where, params = self._context_filters(types, tags)
+        cursor = self.conn.execute(
+            f"SELECT COUNT(*) AS count FROM contexts WHERE {where}", params
+        )
+        return int(cursor.fetchone()["count"])
+
+    @staticmethod
+    def _context_filters(
+        types: list[ContextType] | None,
+        tags: list[str] | None,
+    ) -> tuple[str, list]:
+        """Build the WHERE clause and parameters for context filters."""
+        where = "1=1"
         params: list = []
 
         if types:
             placeholders = ",".join("?" for _ in types)
-            query += f" AND type IN ({placeholders})"
+            where += f" AND type IN ({placeholders})"
             params.extend(types)
 
         if tags:
@@ -261,13 +391,15 @@ class ContextStore:
             for tag in tags:
                 tag_conditions.append("tags LIKE ?")
                 params.append(f'%"{tag}"%')
-            query += f" AND ({' OR '.join(tag_conditions)})"
+                # Rows written before tags were stored unescaped hold
+                # non-ASCII characters as \uXXXX escapes
+                escaped = json.dumps(tag)
+                if escaped != f'"{tag}"':
+                    tag_conditions.append("tags LIKE ?")
+                    params.append(f"%{escaped}%")
+            where += f" AND ({' OR '.join(tag_conditions)})"
 
-        query += " ORDER BY created_at DESC LIMIT ? OFFSET ?"
-        params.extend([limit, offset])
-
-        cursor = self.conn.execute(query, params)
-        return [self._row_to_context(row) for row in cursor.fetchall()]
+        return where, params
 
     def search_by_embedding(
         self,
@@ -280,14 +412,15 @@ class ContextStore:
 
         Returns list of (context, similarity_score) tuples sorted by similarity.
         """
-        # First get candidate context IDs from vector search
+        # First get candidate context IDs from vector search. The k constraint
+        # lets vec0 keep only the top-k neighbours while scanning, and unlike
+        # LIMIT it also works on SQLite builds that don't push LIMIT down.
         cursor = self.conn.execute(
             """
             SELECT context_id, distance
             FROM context_embeddings
-            WHERE embedding MATCH ?
+            WHERE embedding MATCH ? AND k = ?
             ORDER BY distance
-            LIMIT ?
         """,
             (serialize_float32(query_embedding), limit * 2),
         )
@@ -296,33 +429,39 @@ class ContextStore:
         if not candidates:
             return []
 
-        # Fetch full contexts and apply filters
+        # Fetch all candidate contexts in one query instead of one per hit
+        candidate_ids = [row[0] for row in candidates]
+        placeholders = ",".join("?" for _ in candidate_ids)
+        cursor = self.conn.execute(
+            f"SELECT * FROM contexts WHERE id IN ({placeholders})", candidate_ids
+        )
+        contexts_by_id = {
+            row["id"]: self._row_to_context(row, include_embedding=False)
+            for row in cursor
+        }
+
+        # Apply filters in similarity order
         results = []
-        for row in candidates:
-            context_id = row[0]
-            distance = row[1]
+        for context_id, distance in candidates:
+            context = contexts_by_id.get(context_id)
+            if context is None:
+                continue
+
+            # Apply type filter
+            if types and context.type not in types:
+                continue
+
+            # Apply tag filter
+            if tags and not any(tag in context.tags for tag in tags):
+                continue
 
             # Convert distance to similarity (assuming cosine distance)
             # sqlite-vec uses L2 distance by default, so we use 1 / (1 + distance)
             similarity = 1 / (1 + distance)
+            results.append((context, similarity))
 
-            try:
-                context = self.get_context(context_id)
-
-                # Apply type filter
-                if types and context.type not in types:
-                    continue
-
-                # Apply tag filter
-                if tags and not any(tag in context.tags for tag in tags):
-                    continue
-
-                results.append((context, similarity))
-
-                if len(results) >= limit:
-                    break
-            except ContextNotFoundError:
-                continue
+            if len(results) >= limit:
+                break
 
         return results
 
@@ -351,15 +490,14 @@ class ContextStore:
         """Record access to contexts (updates accessed_at and access_count)."""
         now = datetime.now(timezone.utc).isoformat()
         try:
-            for context_id in context_ids:
-                self.conn.execute(
-                    """
-                    UPDATE contexts
-                    SET accessed_at = ?, access_count = access_count + 1
-                    WHERE id = ?
-                """,
-                    (now, str(context_id)),
-                )
+            self.conn.executemany(
+                """
+                UPDATE contexts
+                SET accessed_at = ?, access_count = access_count + 1
+                WHERE id = ?
+            """,
+                [(now, str(context_id)) for context_id in context_ids],
+            )
             self.conn.commit()
         except sqlite3.Error as e:
             self.conn.rollback()
@@ -380,8 +518,8 @@ class ContextStore:
                     entry.timestamp.isoformat(),
                     entry.agent_id,
                     entry.task,
-                    json.dumps([str(c) for c in entry.contexts_served]),
-                    json.dumps(entry.relevance_scores),
+                    dumps([str(c) for c in entry.contexts_served]),
+                    dumps(entry.relevance_scores),
                     entry.tokens_used,
                     entry.tokens_budget,
                     entry.request_source,
@@ -414,55 +552,86 @@ class ContextStore:
         cursor = self.conn.execute(query, params)
         return [self._row_to_audit_entry(row) for row in cursor.fetchall()]
 
-    def get_stats(self) -> dict:
-        """Get storage statistics."""
-        stats = {}
-
-        # Context counts by type
-        cursor = self.conn.execute(
-            "SELECT type, COUNT(*) as count FROM contexts GROUP BY type"
-        )
-        stats["contexts_by_type"] = {row["type"]: row["count"] for row in cursor}
+    def count_audit_entries(self, agent_id: str | None = None) -> int:
+        """Count audit log entries, optionally for a single agent."""
+        query = "SELECT COUNT(*) AS count FROM audit_log"
+        params: list = []
 
-        # Total contexts
-        cursor = self.conn.execute("SELECT COUNT(*) as count FROM contexts")
-        stats["total_contexts"] = cursor.fetchone()["count"]
+        if agent_id:
+            query += " WHERE agent_id = ?"
+            params.append(agent_id)
 
-        # Total audit entries
-        cursor = self.conn.execute("SELECT COUNT(*) as count FROM audit_log")
-        stats["total_audit_entries"] = cursor.fetchone()["count"]
+        cursor = self.conn.execute(query, params)
+        return int(cursor.fetchone()["count"])
 
-        # Contexts with embeddings
+    def get_stats(self) -> dict:
+        """Get storage statistics."""
+        # Gather every count in one round trip; totals derive from the type counts
         cursor = self.conn.execute(
-            "SELECT COUNT(*) as count FROM context_embeddings"
+            """
+            SELECT 'type' AS kind, type AS key, COUNT(*) AS count
+            FROM contexts GROUP BY type
+            UNION ALL
+            SELECT 'audit', NULL, COUNT(*) FROM audit_log
+            UNION ALL
+            SELECT 'embeddings', NULL, COUNT(*) FROM context_embeddings
+            """
         )
-        stats["contexts_with_embeddings"] = cursor.fetchone()["count"]
-
-        return stats
 
-    def iter_contexts(self) -> Iterator[Context]:
-        """Iterate over all contexts (memory-efficient for large datasets)."""
-        cursor = self.conn.execute("SELECT * FROM contexts ORDER BY created_at")
+        contexts_by_type: dict[str, int] = {}
+        totals: dict[str, int] = {}
         for row in cursor:
-            yield self._row_to_context(row)
+            if row["kind"] == "type":
+                contexts_by_type[row["key"]] = row["count"]
+            else:
+                totals[row["kind"]] = row["count"]
+
+        return {
+            "contexts_by_type": contexts_by_type,
+            "total_contexts": sum(contexts_by_type.values()),
+            "total_audit_entries": totals["audit"],
+            "contexts_with_embeddings": totals["embeddings"],
+        }
+
+    def iter_contexts(
+        self, include_embeddings: bool = True, newest_first: bool = False
+    ) -> Iterator[Context]:
+        """Iterate over all contexts (memory-efficient for large datasets).
+
+        Rows are read from a dedicated connection, so the iterator can be
+        advanced from different threads (e.g. a streaming response) and
+        sees one consistent snapshot of the table.
+        """
+        order = "DESC" if newest_first else "ASC"
+        with closing(self._connect()) as conn:
+            cursor = conn.execute(
+                f"SELECT * FROM contexts ORDER BY created_at {order}"
+            )
+            for row in cursor:
+                yield self._row_to_context(row, include_embedding=include_embeddings)
 
-    def _row_to_context(self, row: sqlite3.Row) -> Context:
+    def _row_to_context(
+        self, row: sqlite3.Row, include_embedding: bool = True
+    ) -> Context:
         """Convert a database row to a Context object."""
-        # Get embedding if exists
+        # Get embedding if exists and requested
         embedding = None
-        cursor = self.conn.execute(
-            "SELECT embedding FROM context_embeddings WHERE context_id = ?",
-            (row["id"],),
-        )
-        embed_row = cursor.fetchone()
-        if embed_row:
-            embedding = deserialize_float32(embed_row["embedding"])
+        if include_embedding:
+            cursor = self.conn.execute(
+                "SELECT embedding FROM context_embeddings WHERE context_id = ?",
+                (row["id"],),
+            )
+            embed_row = cursor.fetchone()
+            if embed_row:
+                embedding = deserialize_float32(embed_row["embedding"])
 
-        return Context(
+        # Rows were validated on the way in; skip pydantic re-validation.
+        # type stays a plain string, as use_enum_values would store it.
+        return Context.model_construct(
             id=UUID(row["id"]),
-            type=ContextType(row["type"]),
+            type=row["type"],
             content=row["content"],
-            tags=json.loads(row["tags"]),
+            tags=loads(row["tags"]),
             source=row["source"],
             embedding=embedding,
             created_at=datetime.fromisoformat(row["created_at"]),
@@ -473,7 +642,7 @@ class ContextStore:
                 else None
             ),
             access_count=row["access_count"],
-            metadata=json.loads(row["metadata"]),
+            metadata=loads(row["metadata"]),
         )
 
     def _row_to_audit_entry(self, row: sqlite3.Row) -> AuditEntry:
@@ -483,20 +652,24 @@ class ContextStore:
             timestamp=datetime.fromisoformat(row["timestamp"]),
             agent_id=row["agent_id"],
             task=row["task"],
-            contexts_served=[UUID(c) for c in json.loads(row["contexts_served"])],
-            relevance_scores=json.loads(row["relevance_scores"]),
+            contexts_served=[UUID(c) for c in loads(row["contexts_served"])],
+            relevance_scores=loads(row["relevance_scores"]),
             tokens_used=row["tokens_used"],
             tokens_budget=row["tokens_budget"],
-            request_source=RequestSource(row["request_source"]),
-            librarian_mode=LibrarianMode(row["librarian_mode"]),
+            request_source=_REQUEST_SOURCES[row["request_source"]],
+            librarian_mode=_LIBRARIAN_MODES[row["librarian_mode"]],
             latency_ms=row["latency_ms"],
         )
 
     def close(self) -> None:
-        """Close the database connection."""
-        if self._conn:
-            self._conn.close()
-            self._conn = None
+        """Close the database connections of all threads."""
+        with self._connections_lock:
+            connections = list(self._connections)
+            self._connections.clear()
+        # Drop every thread's reference so later use reconnects
+        self._local = threading.local()
+        for conn in connections:
+            conn.close()
 
     def __enter__(self) -> "ContextStore":
         return self
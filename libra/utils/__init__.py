@@ -1,9 +1,11 @@
 """Utility functions for libra."""
 
+from libra.utils.cache import LRUCache
 from libra.utils.logging import get_default_logger, get_logger, setup_logging
 from libra.utils.tokens import count_tokens, estimate_tokens, truncate_to_tokens
 
 __all__ = [
+    "LRUCache",
     "count_tokens",
     "estimate_tokens",
     "truncate_to_tokens",
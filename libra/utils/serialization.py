@@ -0,0 +1,67 @@
+"""JSON serialization helpers for libra."""
+
+import json
+from typing import Any, Iterable, Iterator
+
+# Use orjson when installed (pip install libra-context[fast]), else stdlib json
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
+
+def dumps(obj: Any) -> str:
+    """Serialize an object to a compact JSON string.
+
+    Args:
+        obj: JSON-serializable object
+
+    Returns:
+        JSON text
+    """
+    if _HAS_ORJSON:
+        encoded: bytes = orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        return encoded.decode("utf-8")
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+
+def loads(data: str | bytes) -> Any:
+    """Deserialize JSON text.
+
+    Args:
+        data: JSON text as str or bytes
+
+    Returns:
+        The decoded object
+    """
+    if _HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def iter_json_array(
+    items: Iterable[Any], indent: int = 2, level: int = 0
+) -> Iterator[str]:
+    """Encode an iterable as an indented JSON array, one element at a time.
+
+    The concatenated chunks equal json.dumps(list(items), indent=indent),
+    so callers can write or stream large arrays without building the list.
+
+    Args:
+        items: JSON-serializable elements
+        indent: Spaces per indentation level
+        level: Nesting level of the array itself (when embedded in an object)
+
+    Yields:
+        Consecutive chunks of the encoded array
+    """
+    pad = " " * (indent * (level + 1))
+    empty = True
+    for item in items:
+        # Encoded strings escape newlines, so every newline here is layout
+        text = json.dumps(item, indent=indent).replace("\n", "\n" + pad)
+        yield ("[\n" if empty else ",\n") + pad + text
+        empty = False
+    yield "[]" if empty else "\n" + " " * (indent * level) + "]"
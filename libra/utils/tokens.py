@@ -1,17 +1,66 @@
 """Token counting utilities for libra."""
 
+import logging
 import re
+import time
 from typing import Any
 
-# Try to import tiktoken for accurate counting, fall back to estimation
-try:
-    import tiktoken
+logger = logging.getLogger("libra.utils.tokens")
 
-    _ENCODING: Any = tiktoken.get_encoding("cl100k_base")
-    _HAS_TIKTOKEN = True
-except ImportError:
-    _ENCODING = None
-    _HAS_TIKTOKEN = False
+# Seconds to wait before retrying a failed (non-import) encoding load
+_ENCODING_RETRY_SECONDS = 300.0
+
+# Loaded tiktoken encoding; stays None until a load succeeds
+_encoding: Any = None
+# Set once tiktoken turns out not to be installed; never retried
+_tiktoken_missing = False
+# time.monotonic() before which a failed load is not retried
+_retry_after = 0.0
+_fallback_warned = False
+
+# Whitespace and punctuation runs that separate words for estimate_tokens
+_WORD_SEPARATOR_RE = re.compile(r"[\s\-_.,;:!?()\"']+")
+
+
+def _get_encoding() -> Any:
+    """Load the tiktoken encoding on first use.
+
+    Importing tiktoken and loading its BPE ranks (which may be downloaded on
+    first run) is deferred until a token count is actually needed. A missing
+    tiktoken is remembered for good; any other load failure (e.g. offline)
+    is retried at most every _ENCODING_RETRY_SECONDS.
+
+    Returns:
+        The cl100k_base encoding, or None to fall back to estimation
+    """
+    global _encoding, _tiktoken_missing, _retry_after, _fallback_warned
+    if _encoding is not None or _tiktoken_missing:
+        return _encoding
+    if time.monotonic() < _retry_after:
+        return None
+
+    try:
+        import tiktoken
+
+        _encoding = tiktoken.get_encoding("cl100k_base")
+    except ImportError as e:
+        _tiktoken_missing = True
+        _warn_fallback(e)
+    except Exception as e:
+        # Encoding could not be loaded (e.g. BPE download failed offline)
+        _retry_after = time.monotonic() + _ENCODING_RETRY_SECONDS
+        _warn_fallback(e)
+    return _encoding
+
+
+def _warn_fallback(error: Exception) -> None:
+    """Log the first fallback to estimated token counts."""
+    global _fallback_warned
+    if not _fallback_warned:
+        logger.warning(
+            "tiktoken encoding unavailable, estimating token counts: %s", error
+        )
+        _fallback_warned = True
 
 
 def count_tokens(text: str) -> int:
@@ -25,8 +74,9 @@ def count_tokens(text: str) -> int:
     Returns:
         Number of tokens
     """
-    if _HAS_TIKTOKEN and _ENCODING is not None:
-        return len(_ENCODING.encode(text))
+    encoding = _get_encoding()
+    if encoding is not None:
+        return len(encoding.encode(text))
 
     # Fallback: estimate based on words and characters
     return estimate_tokens(text)
@@ -45,8 +95,9 @@ def estimate_tokens(text: str) -> int:
         Estimated number of tokens
     """
     # Count words (split on whitespace and punctuation)
-    words = re.split(r"[\s\-_.,;:!?()\"']+", text)
-    word_count = len([w for w in words if w])
+    words = _WORD_SEPARATOR_RE.split(text)
+    # Empty strings only appear at the edges; count them instead of filtering
+    word_count = len(words) - words.count("")
 
     # Count characters
     char_count = len(text)
@@ -68,11 +119,12 @@ def truncate_to_tokens(text: str, max_tokens: int) -> str:
     Returns:
         Truncated text
     """
-    if _HAS_TIKTOKEN and _ENCODING is not None:
-        tokens = _ENCODING.encode(text)
+    encoding = _get_encoding()
+    if encoding is not None:
+        tokens = encoding.encode(text)
         if len(tokens) <= max_tokens:
             return text
-        decoded: str = _ENCODING.decode(tokens[:max_tokens])
+        decoded: str = encoding.decode(tokens[:max_tokens])
         return decoded
 
     # Fallback: truncate by estimated ratio
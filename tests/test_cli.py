@@ -0,0 +1,119 @@
+"""Tests for the command-line interface."""
+
+import json
+from datetime import datetime, timedelta, timezone
+
+from typer.testing import CliRunner
+
+from libra.core.config import LibraConfig
+from libra.core.models import Context, ContextType
+from libra.embedding.base import EmbeddingProvider
+from libra.interfaces import cli
+from libra.service import LibraService
+
+
+class FailingEmbedder(EmbeddingProvider):
+    """Embedding stub that fails on any text containing "bad"."""
+
+    @property
+    def dimensions(self) -> int:
+        return 768
+
+    def embed(self, text: str) -> list[float]:
+        return self.embed_batch([text])[0]
+
+    def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        if any("bad" in text for text in texts):
+            raise RuntimeError("embedding failed")
+        return [[0.1] * 768 for _ in texts]
+
+
+class TestImportCommand:
+    """Tests for `libra import`."""
+
+    def test_failed_batch_falls_back_to_per_item_import(
+        self, temp_dir, monkeypatch
+    ):
+        """Test a failing batch is retried item by item without duplicates."""
+        config = LibraConfig(data_dir=temp_dir)
+        config.embedding.batch_size = 2
+        service = LibraService(config=config)
+        service._embedding_provider = FailingEmbedder()
+        monkeypatch.setattr(cli, "_service", service)
+
+        items = [
+            {"type": "knowledge", "content": text}
+            for text in ["one", "two", "three", "bad four", "five"]
+        ]
+        input_file = temp_dir / "import.json"
+        input_file.write_text(json.dumps(items))
+
+        result = CliRunner().invoke(cli.app, ["import", str(input_file)])
+
+        assert result.exit_code == 0
+        assert "Batch failed after 2 contexts were imported" in result.output
+        assert "Imported 4 contexts" in result.output
+        stored = sorted(c.content for c in service.list_contexts())
+        assert stored == ["five", "one", "three", "two"]
+        service.store.close()
+
+
+class TestExportCommand:
+    """Tests for `libra export`."""
+
+    def test_export_writes_newest_first(self, temp_dir, monkeypatch):
+        """Test the streamed export matches a one-shot dump, newest first."""
+        service = LibraService(config=LibraConfig(data_dir=temp_dir))
+        service._embedding_provider = FailingEmbedder()
+        monkeypatch.setattr(cli, "_service", service)
+
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        service.add_contexts(
+            [
+                Context(
+                    type=ContextType.KNOWLEDGE,
+                    content=content,
+                    tags=["café"],
+                    created_at=start + timedelta(days=i),
+                )
+                for i, content in enumerate(["first", "second\nline", "third"])
+            ]
+        )
+        output = temp_dir / "export.json"
+
+        result = CliRunner().invoke(cli.app, ["export", "--output", str(output)])
+
+        assert result.exit_code == 0
+        assert "Exported 3 contexts" in result.output
+        expected = [
+            {
+                "id": str(c.id),
+                "type": c.type,
+                "content": c.content,
+                "tags": c.tags,
+                "source": c.source,
+                "created_at": c.created_at.isoformat(),
+                "access_count": c.access_count,
+            }
+            for c in service.list_contexts()
+        ]
+        assert [item["content"] for item in expected] == [
+            "third",
+            "second\nline",
+            "first",
+        ]
+        assert output.read_text() == json.dumps(expected, indent=2)
+        service.store.close()
+
+    def test_export_empty_store(self, temp_dir, monkeypatch):
+        """Test exporting an empty store writes an empty JSON array."""
+        service = LibraService(config=LibraConfig(data_dir=temp_dir))
+        monkeypatch.setattr(cli, "_service", service)
+        output = temp_dir / "export.json"
+
+        result = CliRunner().invoke(cli.app, ["export", "--output", str(output)])
+
+        assert result.exit_code == 0
+        assert output.read_text() == "[]"
+        service.store.close()
+
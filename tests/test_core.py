@@ -1,9 +1,14 @@
 """Tests for core data models and configuration."""
 
+import os
+import stat
 from datetime import datetime
 from uuid import UUID
 
-from libra.core.config import LibraConfig, LibrarianRule
+import pytest
+import yaml
+
+from libra.core.config import _CONFIG_CACHE, LibraConfig, LibrarianRule
 from libra.core.exceptions import (
     ContextNotFoundError,
     EmbeddingError,
@@ -38,6 +43,17 @@ class TestContextModel:
         assert isinstance(context.id, UUID)
         assert isinstance(context.created_at, datetime)
 
+    def test_context_updated_at_defaults_to_created_at(self):
+        """Test a new context's updated_at matches its created_at."""
+        context = Context(type=ContextType.KNOWLEDGE, content="Test content")
+        assert context.updated_at == context.created_at
+
+        created_at = datetime(2024, 1, 1)
+        imported = Context(
+            type=ContextType.KNOWLEDGE, content="Imported", created_at=created_at
+        )
+        assert imported.updated_at == created_at
+
     def test_context_touch(self):
         """Test context access tracking."""
         context = Context(
@@ -187,6 +203,51 @@ class TestLibraConfig:
         coding_rules = [r for r in rules if "code" in r.pattern]
         assert len(coding_rules) > 0
 
+    def test_load_reuses_parse_until_file_changes(self, temp_dir):
+        """Test repeated loads return independent configs and see file edits."""
+        path = temp_dir / "config.yaml"
+        path.write_text("log_level: debug\n")
+        cached_files = len(_CONFIG_CACHE)
+
+        first = LibraConfig.load(path)
+        first.log_level = "error"
+        second = LibraConfig.load(path)
+        assert second.log_level == "debug"
+
+        path.write_text("log_level: warning\n")
+        assert LibraConfig.load(path).log_level == "warning"
+
+        # An edit replaces the file's cache entry rather than adding one
+        assert len(_CONFIG_CACHE) == cached_files + 1
+        assert _CONFIG_CACHE[os.path.abspath(path)][2] == {"log_level": "warning"}
+
+    @pytest.mark.skipif(os.name == "nt", reason="POSIX file modes")
+    def test_save_preserves_file_mode(self, temp_dir):
+        """Test save keeps the existing config's permissions."""
+        path = temp_dir / "config.yaml"
+        path.write_text("log_level: info\n")
+        path.chmod(0o640)
+
+        LibraConfig(data_dir=temp_dir).save(path)
+
+        assert stat.S_IMODE(path.stat().st_mode) == 0o640
+        assert [p.name for p in temp_dir.iterdir()] == ["config.yaml"]
+
+    def test_save_removes_temp_file_on_failure(self, temp_dir, monkeypatch):
+        """Test a failed save leaves the original config and no temp file."""
+        path = temp_dir / "config.yaml"
+        path.write_text("log_level: info\n")
+
+        def fail_dump(*args, **kwargs):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(yaml, "safe_dump", fail_dump)
+        with pytest.raises(OSError):
+            LibraConfig(data_dir=temp_dir).save(path)
+
+        assert path.read_text() == "log_level: info\n"
+        assert [p.name for p in temp_dir.iterdir()] == ["config.yaml"]
+
 
 class TestExceptions:
     """Tests for custom exceptions."""
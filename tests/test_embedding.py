@@ -0,0 +1,36 @@
+"""Tests for embedding providers."""
+
+from types import SimpleNamespace
+
+from libra.embedding.gemini import GeminiEmbeddingProvider
+
+
+class FakeModels:
+    """Stand-in for the GenAI client's models API that records requests."""
+
+    def __init__(self):
+        self.request_sizes: list[int] = []
+
+    def embed_content(self, model, contents, config):
+        self.request_sizes.append(len(contents))
+        return SimpleNamespace(
+            embeddings=[
+                SimpleNamespace(values=[float(text)]) for text in contents
+            ]
+        )
+
+
+class TestGeminiEmbeddingProvider:
+    """Tests for GeminiEmbeddingProvider."""
+
+    def test_embed_batch_splits_large_batches(self):
+        """Test batches over the API limit are sent in slices, in order."""
+        provider = GeminiEmbeddingProvider(api_key="test-key")
+        models = FakeModels()
+        provider._client = SimpleNamespace(models=models)
+
+        texts = [str(i) for i in range(250)]
+        embeddings = provider.embed_batch(texts)
+
+        assert models.request_sizes == [100, 100, 50]
+        assert embeddings == [[float(i)] for i in range(250)]
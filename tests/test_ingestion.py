@@ -7,6 +7,7 @@ import pytest
 
 from libra.core.models import ContextType
 from libra.ingestion.chunker import Chunker, ChunkResult
+from libra.ingestion.directory import DirectoryIngestor
 from libra.ingestion.markdown import MarkdownIngestor
 from libra.ingestion.text import TextIngestor
 
@@ -255,3 +256,26 @@ Section B content.
 
         finally:
             path.unlink()
+
+
+class TestDirectoryIngestor:
+    """Tests for DirectoryIngestor."""
+
+    def test_respects_gitignore_patterns(self, temp_dir):
+        """Test exact, wildcard and directory gitignore patterns."""
+        (temp_dir / ".gitignore").write_text(
+            "# comment\nsecret.txt\n*.log.md\ntmp*\nout/\n"
+        )
+        (temp_dir / "keep.md").write_text("Keep me")
+        (temp_dir / "secret.txt").write_text("Secret")
+        (temp_dir / "debug.log.md").write_text("Log")
+        (temp_dir / "tmpfile.txt").write_text("Scratch")
+        (temp_dir / "out").mkdir()
+        (temp_dir / "out" / "built.md").write_text("Built")
+        (temp_dir / "out.txt").write_text("Not a directory")
+
+        ingestor = DirectoryIngestor()
+        contexts = ingestor.ingest(temp_dir, ContextType.KNOWLEDGE)
+
+        sources = sorted(Path(c.source).name for c in contexts)
+        assert sources == ["keep.md", "out.txt"]
@@ -1,13 +1,52 @@
 """Tests for librarian layer."""
 
+import json
+import time
+from types import SimpleNamespace
+
 import pytest
 
 from libra.core.config import LibrarianRule
 from libra.core.models import Context, ContextRequest, ContextType, ScoredContext
 from libra.librarian.budget import BudgetManager
+from libra.librarian.llm import GeminiLibrarian
+from libra.librarian.llm_generic import GenericLLMLibrarian
 from libra.librarian.rules import RulesLibrarian
 
 
+def candidate_ids(prompt: str) -> list[str]:
+    """Return the candidate IDs listed in a selection prompt, in order."""
+    return [
+        line[len("ID: ") :] for line in prompt.splitlines() if line.startswith("ID: ")
+    ]
+
+
+class FakeLLM:
+    """LLM provider stub that scores candidates at 0.8 and counts calls."""
+
+    model_name = "fake-model"
+
+    def __init__(self, first_only: bool = False, slow_id: str | None = None):
+        """Initialize the stub.
+
+        Args:
+            first_only: Select only the first candidate of each prompt
+            slow_id: Delay the response when this ID is the first candidate
+        """
+        self.first_only = first_only
+        self.slow_id = slow_id
+        self.calls = 0
+
+    def generate_json(self, prompt):
+        self.calls += 1
+        ids = candidate_ids(prompt)
+        if ids and ids[0] == self.slow_id:
+            time.sleep(0.05)
+        if self.first_only:
+            ids = ids[:1]
+        return {"selections": [{"id": i, "score": 0.8} for i in ids]}
+
+
 class TestRulesLibrarian:
     """Tests for RulesLibrarian."""
 
@@ -244,3 +283,80 @@ class TestBudgetManager:
         selected, tokens_used = budget_manager.optimize(contexts, budget=500)
 
         assert tokens_used <= 500
+
+
+class TestGenericLLMLibrarian:
+    """Tests for GenericLLMLibrarian."""
+
+    def test_repeated_request_uses_response_cache(self):
+        """Test identical requests reuse the cached LLM response."""
+        llm = FakeLLM()
+        librarian = GenericLLMLibrarian(llm_provider=llm)
+        request = ContextRequest(task="Write a Python function")
+        candidates = [
+            Context(type=ContextType.KNOWLEDGE, content="Python tips"),
+            Context(type=ContextType.PREFERENCE, content="Use type hints"),
+        ]
+
+        first = librarian.select(request, candidates)
+        second = librarian.select(request, candidates)
+
+        assert llm.calls == 1
+        assert len(first) == len(second) == 2
+
+    def test_invalid_max_concurrent_batches(self):
+        """Test a non-positive batch concurrency is rejected."""
+        with pytest.raises(ValueError):
+            GenericLLMLibrarian(llm_provider=FakeLLM(), max_concurrent_batches=0)
+
+    def test_concurrent_batches_merge_in_order(self):
+        """Test batch results keep batch order when batches finish out of order."""
+        candidates = [
+            Context(type=ContextType.KNOWLEDGE, content=f"Note {i}") for i in range(9)
+        ]
+        # The first batch answers last; each batch selects its first candidate
+        llm = FakeLLM(first_only=True, slow_id=str(candidates[0].id))
+        librarian = GenericLLMLibrarian(
+            llm_provider=llm,
+            max_candidates_per_request=3,
+            max_concurrent_batches=3,
+        )
+        request = ContextRequest(task="Summarize the notes")
+
+        scored = librarian.select(request, candidates)
+
+        assert [s.context.id for s in scored] == [
+            candidates[0].id,
+            candidates[3].id,
+            candidates[6].id,
+        ]
+
+
+class TestGeminiLibrarian:
+    """Tests for GeminiLibrarian."""
+
+    class FakeModels:
+        """Stand-in for the GenAI models API, answering like FakeLLM."""
+
+        def __init__(self):
+            self.llm = FakeLLM()
+
+        def generate_content(self, model, contents, config):
+            return SimpleNamespace(text=json.dumps(self.llm.generate_json(contents)))
+
+    def test_repeated_request_uses_response_cache(self):
+        """Test identical requests reuse the cached Gemini response."""
+        librarian = GeminiLibrarian(api_key="test-key")
+        models = self.FakeModels()
+        librarian._client = SimpleNamespace(models=models)
+        request = ContextRequest(task="Write a Python function")
+        candidates = [
+            Context(type=ContextType.KNOWLEDGE, content="Python tips"),
+            Context(type=ContextType.PREFERENCE, content="Use type hints"),
+        ]
+
+        first = librarian.select(request, candidates)
+        second = librarian.select(request, candidates)
+
+        assert models.llm.calls == 1
+        assert len(first) == len(second) == 2
@@ -1,12 +1,14 @@
 """Tests for storage layer."""
 
+import sqlite3
 import tempfile
+import threading
 from pathlib import Path
 from uuid import uuid4
 
 import pytest
 
-from libra.core.exceptions import ContextNotFoundError
+from libra.core.exceptions import ContextNotFoundError, StorageError
 from libra.core.models import (
     AuditEntry,
     Context,
@@ -46,6 +48,21 @@ class TestContextStore:
         assert retrieved.type == ContextType.KNOWLEDGE
         assert retrieved.tags == ["python", "programming"]
 
+    def test_add_contexts_is_atomic(self, temp_db):
+        """Test bulk add stores all contexts, or none on failure."""
+        contexts = [
+            Context(type=ContextType.KNOWLEDGE, content=f"Chunk {i}")
+            for i in range(3)
+        ]
+        temp_db.add_contexts(contexts)
+        assert len(temp_db.list_contexts()) == 3
+
+        # A duplicate id rolls back the whole batch
+        fresh = Context(type=ContextType.KNOWLEDGE, content="Fresh")
+        with pytest.raises(StorageError):
+            temp_db.add_contexts([fresh, contexts[0]])
+        assert len(temp_db.list_contexts()) == 3
+
     def test_get_nonexistent_context(self, temp_db):
         """Test getting a context that doesn't exist."""
         with pytest.raises(ContextNotFoundError):
@@ -128,6 +145,63 @@ class TestContextStore:
         assert len(python_contexts) == 1
         assert "python" in python_contexts[0].tags
 
+    def test_list_contexts_by_non_ascii_tag(self, temp_db):
+        """Test non-ASCII tags round-trip and match the tag filter."""
+        context = Context(type=ContextType.KNOWLEDGE, content="Menu", tags=["café"])
+        temp_db.add_context(context)
+
+        assert temp_db.get_context(context.id).tags == ["café"]
+        matches = temp_db.list_contexts(tags=["café"])
+        assert [c.id for c in matches] == [context.id]
+
+    def test_non_ascii_tag_filter_matches_escaped_rows(self, temp_db):
+        """Test tag filters still match rows stored with ASCII-escaped tags."""
+        context = Context(type=ContextType.KNOWLEDGE, content="Menu", tags=["café"])
+        temp_db.add_context(context)
+        # Simulate a row written when tags were serialized with \uXXXX escapes
+        temp_db.conn.execute(
+            "UPDATE contexts SET tags = ? WHERE id = ?",
+            ('["caf\\u00e9"]', str(context.id)),
+        )
+        temp_db.conn.commit()
+
+        matches = temp_db.list_contexts(tags=["café"])
+        assert [c.id for c in matches] == [context.id]
+        assert matches[0].tags == ["café"]
+        assert temp_db.count_contexts(tags=["café"]) == 1
+
+    def test_count_contexts(self, temp_db):
+        """Test counting contexts with the list filters."""
+        temp_db.add_context(
+            Context(type=ContextType.KNOWLEDGE, content="Python", tags=["python"])
+        )
+        temp_db.add_context(
+            Context(type=ContextType.PREFERENCE, content="Style", tags=["python"])
+        )
+        temp_db.add_context(Context(type=ContextType.KNOWLEDGE, content="Java"))
+
+        assert temp_db.count_contexts() == 3
+        assert temp_db.count_contexts(types=[ContextType.KNOWLEDGE]) == 2
+        assert temp_db.count_contexts(tags=["python"]) == 2
+
+    def test_thread_connections_closed_on_thread_exit(self, temp_db):
+        """Test connections opened by short-lived threads are released."""
+        opened = []
+
+        def use_store():
+            opened.append(temp_db.conn)
+            temp_db.count_contexts()
+
+        for _ in range(20):
+            thread = threading.Thread(target=use_store)
+            thread.start()
+            thread.join()
+
+        # Only the creating thread's connection remains registered
+        assert temp_db._connections == {temp_db.conn}
+        with pytest.raises(sqlite3.ProgrammingError):
+            opened[0].execute("SELECT 1")
+
     def test_record_access(self, temp_db):
         """Test recording access to contexts."""
         context = Context(
@@ -186,6 +260,8 @@ class TestAuditLog:
 
         agent1_entries = temp_db.get_audit_entries(agent_id="agent-1")
         assert len(agent1_entries) == 3
+        assert temp_db.count_audit_entries(agent_id="agent-1") == 3
+        assert temp_db.count_audit_entries() == 4
 
 
 class TestStorageStats:
@@ -228,6 +304,20 @@ class TestVectorSearch:
         assert retrieved.embedding is not None
         assert len(retrieved.embedding) == 768
 
+    def test_list_contexts_skips_embeddings(self, temp_db):
+        """Test list views only load embeddings on request."""
+        temp_db.add_context(
+            Context(
+                type=ContextType.KNOWLEDGE,
+                content="Test content",
+                embedding=[0.1] * 768,
+            )
+        )
+
+        assert temp_db.list_contexts()[0].embedding is None
+        listed = temp_db.list_contexts(include_embeddings=True)
+        assert len(listed[0].embedding) == 768
+
     def test_search_by_embedding(self, temp_db):
         """Test searching by embedding similarity."""
         # Add contexts with embeddings
@@ -163,6 +163,19 @@ class TestSettingsPage:
         assert "Export" in response.text
 
 
+class TestExport:
+    """Tests for the JSON export download."""
+
+    def test_export_returns_json(self, client):
+        """Test that export streams a valid JSON document."""
+        response = client.get("/export")
+        assert response.status_code == 200
+        assert "attachment" in response.headers["content-disposition"]
+        data = response.json()
+        assert data["version"] == "1.0"
+        assert isinstance(data["contexts"], list)
+
+
 class TestStaticFiles:
     """Tests for static file serving."""
 